@@ -0,0 +1,93 @@
+import importlib
+from functools import lru_cache
+
+import pytest
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--run-live",
+        action="store_true",
+        default=False,
+        help="run tests marked 'live' against the real GPT Researcher backend",
+    )
+
+
+def pytest_configure(config):
+    config.addinivalue_line(
+        "markers",
+        "live: calls the real GPT Researcher backend (LLM and web search); only runs with --run-live",
+    )
+    if not config.pluginmanager.hasplugin("recording"):
+        # pytest-recording registers this itself when it is installed
+        config.addinivalue_line("markers", "vcr: record and replay the test's HTTP traffic (needs pytest-recording)")
+
+
+def pytest_collection_modifyitems(config, items):
+    """Skip tests marked 'live' unless --run-live was given."""
+    if config.getoption("--run-live"):
+        return
+    skip_live = pytest.mark.skip(reason="needs --run-live")
+    for item in items:
+        if "live" in item.keywords:
+            item.add_marker(skip_live)
+
+
+@pytest.fixture(scope="session")
+def research_server():
+    """The gpt_researcher_mcp module, imported on first use and shared by every test in the session."""
+    return importlib.import_module("gpt_researcher_mcp")
+
+
+@pytest.fixture(scope="module")
+def vcr_config():
+    """pytest-recording settings: record a cassette once, replay it afterwards, and keep credentials out of it."""
+    return {
+        "record_mode": "once",
+        "filter_headers": ["authorization", "x-api-key"],
+        "filter_post_data_parameters": ["api_key"],
+    }
+
+
+class _FakeResearchResult:
+    def __init__(self, query: str, report_type: str):
+        self.citations = [f"https://example.com/{report_type}"]
+        self.research_steps = ["search", "summarize"]
+        self.research_tree = {query: []}
+        self.subtopics_count = 0
+
+
+@lru_cache(maxsize=None)
+def _fake_response(query: str, report_type: str):
+    """Canned (research result, report) for a query; repeated queries share one object."""
+    return _FakeResearchResult(query, report_type), f"# {query}\n\nCanned {report_type} for tests."
+
+
+class FakeGPTResearcher:
+    """Stand-in for gpt_researcher.GPTResearcher that answers from _fake_response."""
+
+    def __init__(self, query, report_type="research_report", report_source="web", mcp_configs=None, **kwargs):
+        self.query = query
+        self.report_type = report_type
+
+    async def conduct_research(self):
+        return _fake_response(self.query, self.report_type)[0]
+
+    async def conduct_deep_research(self):
+        return _fake_response(self.query, self.report_type)[0]
+
+    async def write_report(self):
+        return _fake_response(self.query, self.report_type)[1]
+
+    async def get_timestamp(self):
+        return "2025-01-01T00:00:00"
+
+
+@pytest.fixture
+def fake_researcher(request, monkeypatch, research_server):
+    """Route research tools to FakeGPTResearcher, except in tests marked 'live'."""
+    if request.node.get_closest_marker("live") is None:
+        monkeypatch.setattr(research_server, "_GPTResearcher", FakeGPTResearcher)
+    yield
+    research_server._RESEARCH_CACHE.clear()
+    research_server._CACHE_STATS.update(hits=0, misses=0)
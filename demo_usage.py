@@ -7,189 +7,361 @@ and shows what you can do with it.
 """
 
 import asyncio
-import json
 import os
+import sys
+import time
+from typing import Any
 from gpt_researcher_mcp import mcp
 from fastmcp.client import Client
 
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
 
-async def demo_basic_functionality():
+# Shared arguments for the web research calls here and in direct_usage_example.py;
+# per-call fields are merged in
+_WEB_RESEARCH_ARGS = {
+    "report_type": "research_report",
+    "report_source": "web",
+    "max_iterations": 1,
+}
+
+# Number of failed demo sections after which main() stops early
+MAX_DEMO_FAILURES = 2
+
+# How long tool/resource/prompt listings are reused before re-fetching
+cache_ttl_seconds = 60
+
+_LIST_CACHE: dict[tuple[int, str], tuple[float, Any]] = {}
+
+# Resource contents by (client, uri); the docs resources never change while
+# the server is running, so entries are kept for the life of the process
+_RESOURCE_CACHE: dict[tuple[int, str], Any] = {}
+
+# API keys the research tools need; without them every research call is doomed
+REQUIRED_API_KEYS = ("OPENAI_API_KEY", "TAVILY_API_KEY")
+
+# validate_research_setup results by client, fetched once per client
+_SETUP: dict[int, "asyncio.Future[dict]"] = {}
+
+
+async def cached_list(client, kind, ttl=None):
+    """Return client.list_<kind>(), reusing a recent result for the same client"""
+    ttl = cache_ttl_seconds if ttl is None else ttl
+    key = (id(client), kind)
+    hit = _LIST_CACHE.get(key)
+    if hit is not None and time.monotonic() - hit[0] < ttl:
+        return hit[1]
+    
+    value = await getattr(client, f"list_{kind}")()
+    _LIST_CACHE[key] = (time.monotonic(), value)
+    return value
+
+
+async def cached_read(client, uri):
+    """Return client.read_resource(uri), reading each URI at most once per client"""
+    key = (id(client), uri)
+    if key not in _RESOURCE_CACHE:
+        _RESOURCE_CACHE[key] = await client.read_resource(uri)
+    return _RESOURCE_CACHE[key]
+
+
+async def cached_setup(client):
+    """Return the decoded validate_research_setup result, calling the tool once per client"""
+    key = id(client)
+    if key not in _SETUP:
+        async def fetch():
+            return _decode(await client.call_tool("validate_research_setup", {})) or {}
+        
+        _SETUP[key] = asyncio.ensure_future(fetch())
+    return await _SETUP[key]
+
+
+def missing_api_keys(setup, keys=REQUIRED_API_KEYS):
+    """Return the names in keys that validate_research_setup reported as unset"""
+    configured = setup.get("validation_results", {}).get("api_keys_configured", {})
+    return [key for key in keys if not configured.get(key)]
+
+
+async def batch(client, operations):
+    """
+    Run several tool calls, as one batch_execute request when the server has it.
+    
+    operations is a list of {"tool": name, "arguments": {...}} dictionaries.
+    Returns one decoded result per operation; failed operations come back as
+    {"success": False, "error": ...}.
+    """
+    tools = await cached_list(client, "tools")
+    if any(tool.name == "batch_execute" for tool in tools):
+        response = _decode(await client.call_tool("batch_execute", {
+            "operations": operations,
+            "max_concurrent": len(operations)
+        })) or {}
+        return [
+            entry["result"] if entry["success"]
+            else {"success": False, "error": entry["error"]}
+            for entry in response.get("results", [])
+        ]
+    
+    results = await asyncio.gather(
+        *(client.call_tool(op["tool"], op["arguments"]) for op in operations),
+        return_exceptions=True,
+    )
+    return [
+        {"success": False, "error": str(result)} if isinstance(result, Exception)
+        else _decode(result)
+        for result in results
+    ]
+
+
+def tool_text(result):
+    """Return the text of a tool result's first content block, or "" if empty"""
+    return result.content[0].text if result.content else ""
+
+
+def _decode(result):
+    """Parse the JSON payload of a tool result, or None if it has no content"""
+    text = tool_text(result)
+    return _json_loads(text) if text else None
+
+
+async def demo_basic_functionality(client):
     """Demonstrate basic MCP server functionality"""
+    lines = ["🚀 GPT Researcher MCP Server Demo"]
+    lines.append("=" * 50)
     
-    print("🚀 GPT Researcher MCP Server Demo")
-    print("=" * 50)
+    # Discovery calls are independent, so issue them concurrently
+    tools, resources, prompts = await asyncio.gather(
+        cached_list(client, "tools"),
+        cached_list(client, "resources"),
+        cached_list(client, "prompts"),
+    )
     
-    async with Client(mcp) as client:
-        print("\n📋 Available Tools:")
-        tools = await client.list_tools()
-        for i, tool in enumerate(tools, 1):
-            print(f"  {i}. {tool.name}")
-            print(f"     {tool.description[:100]}...")
-        
-        print("\n📚 Available Resources:")
-        resources = await client.list_resources()
-        for i, resource in enumerate(resources, 1):
-            print(f"  {i}. {resource.uri}")
-            print(f"     {resource.name}")
-        
-        print("\n💡 Available Prompts:")
-        prompts = await client.list_prompts()
-        for i, prompt in enumerate(prompts, 1):
-            print(f"  {i}. {prompt.name}")
-            print(f"     {prompt.description}")
+    # Slice each description once; tools without one get an empty preview
+    previews = [(tool.description or "")[:100] for tool in tools]
+    
+    lines.append("\n📋 Available Tools:")
+    lines.extend(
+        f"  {i}. {tool.name}\n     {preview}..."
+        for i, (tool, preview) in enumerate(zip(tools, previews), 1)
+    )
+    
+    lines.append("\n📚 Available Resources:")
+    lines.extend(
+        f"  {i}. {resource.uri}\n     {resource.name}"
+        for i, resource in enumerate(resources, 1)
+    )
+    
+    lines.append("\n💡 Available Prompts:")
+    lines.extend(
+        f"  {i}. {prompt.name}\n     {prompt.description}"
+        for i, prompt in enumerate(prompts, 1)
+    )
+    
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
-async def demo_capabilities_check():
+async def demo_capabilities_check(client):
     """Demonstrate capabilities and setup validation"""
+    lines = ["\n🔍 Checking Capabilities and Setup"]
+    lines.append("=" * 50)
     
-    print("\n🔍 Checking Capabilities and Setup")
-    print("=" * 50)
+    # Capabilities and setup validation don't depend on each other
+    capabilities_result, validation = await asyncio.gather(
+        client.call_tool("get_research_capabilities", {}),
+        cached_setup(client),
+    )
     
-    async with Client(mcp) as client:
-        # Check capabilities
-        print("\n1. Getting research capabilities...")
-        capabilities_result = await client.call_tool("get_research_capabilities", {})
-        capabilities_text = capabilities_result.content[0].text if capabilities_result.content else "No content"
-        capabilities = json.loads(capabilities_text)
-        
-        if capabilities.get("success"):
-            print("✅ GPT Researcher is available!")
-            caps = capabilities.get("capabilities", {})
-            print(f"   - Supported report types: {caps.get('supported_report_types', [])}")
-            print(f"   - Supported sources: {caps.get('supported_sources', [])}")
-            print(f"   - Deep research available: {caps.get('deep_research_available', False)}")
-            print(f"   - MCP integration available: {caps.get('mcp_integration_available', False)}")
-        else:
-            print("❌ GPT Researcher not available")
-            print(f"   Error: {capabilities.get('error', 'Unknown error')}")
+    # Check capabilities
+    lines.append("\n1. Getting research capabilities...")
+    capabilities = _decode(capabilities_result) or {}
+    
+    if capabilities.get("success"):
+        lines.append("✅ GPT Researcher is available!")
+        caps = capabilities.get("capabilities", {})
+        lines.append(f"   - Supported report types: {caps.get('supported_report_types', [])}")
+        lines.append(f"   - Supported sources: {caps.get('supported_sources', [])}")
+        lines.append(f"   - Deep research available: {caps.get('deep_research_available', False)}")
+        lines.append(f"   - MCP integration available: {caps.get('mcp_integration_available', False)}")
+    else:
+        lines.append("❌ GPT Researcher not available")
+        lines.append(f"   Error: {capabilities.get('error', 'Unknown error')}")
+    
+    # Validate setup
+    lines.append("\n2. Validating setup...")
+    
+    if validation.get("success"):
+        results = validation.get("validation_results", {})
+        lines.append("📊 Setup Status:")
+        lines.append(f"   - GPT Researcher installed: {results.get('gpt_researcher_installed', False)}")
         
-        # Validate setup
-        print("\n2. Validating setup...")
-        validation_result = await client.call_tool("validate_research_setup", {})
-        validation_text = validation_result.content[0].text if validation_result.content else "No content"
-        validation = json.loads(validation_text)
+        api_keys = results.get("api_keys_configured", {})
+        lines.append("   - API Keys configured:")
+        for key, configured in api_keys.items():
+            status = "✅" if configured else "❌"
+            lines.append(f"     {status} {key}")
         
-        if validation.get("success"):
-            results = validation.get("validation_results", {})
-            print("📊 Setup Status:")
-            print(f"   - GPT Researcher installed: {results.get('gpt_researcher_installed', False)}")
-            
-            api_keys = results.get("api_keys_configured", {})
-            print("   - API Keys configured:")
-            for key, configured in api_keys.items():
-                status = "✅" if configured else "❌"
-                print(f"     {status} {key}")
-            
-            if results.get("setup_instructions"):
-                print("\n📝 Setup Instructions:")
-                for instruction in results["setup_instructions"]:
-                    print(f"   - {instruction}")
+        if results.get("setup_instructions"):
+            lines.append("\n📝 Setup Instructions:")
+            for instruction in results["setup_instructions"]:
+                lines.append(f"   - {instruction}")
+    
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
-async def demo_research_tools():
-    """Demonstrate research tools (will show errors if GPT Researcher not installed)"""
+async def demo_research_tools(client):
+    """Demonstrate research tools (skipped when the required API keys are not set)"""
+    lines = ["\n🔬 Research Tools Demo"]
+    lines.append("=" * 50)
     
-    print("\n🔬 Research Tools Demo")
-    print("=" * 50)
+    # Research calls without API keys only fail after paying full setup cost
+    missing = missing_api_keys(await cached_setup(client))
+    if missing:
+        lines.append(f"\n⏭️  Skipping research demos: missing {', '.join(missing)}")
+        sys.stdout.write("\n".join(lines) + "\n")
+        return
     
-    async with Client(mcp) as client:
-        # Test basic research
-        print("\n1. Testing basic research...")
-        try:
-            result = await client.call_tool("conduct_research", {
-                "query": "What is artificial intelligence?",
-                "report_type": "research_report",
-                "report_source": "web",
-                "max_iterations": 1
-            })
-            
-            result_text = result.content[0].text if result.content else "No content"
-            result_data = json.loads(result_text)
-            
-            if result_data.get("success"):
-                print("✅ Research completed successfully!")
-                print(f"   Query: {result_data.get('query', 'N/A')}")
-                print(f"   Report length: {len(result_data.get('report', ''))} characters")
-                print(f"   Citations: {len(result_data.get('citations', []))} sources")
-            else:
-                print("❌ Research failed")
-                print(f"   Error: {result_data.get('error', 'Unknown error')}")
-                
-        except Exception as e:
-            print(f"❌ Research failed with exception: {e}")
+    # Web and local research hit disjoint backends, so run them concurrently;
+    # return_exceptions keeps one failure from cancelling the other
+    web_result, local_result = await asyncio.gather(
+        client.call_tool("conduct_research", {
+            **_WEB_RESEARCH_ARGS,
+            "query": "What is artificial intelligence?",
+            "summary_only": True
+        }),
+        client.call_tool("research_local_documents", {
+            "query": "Test query",
+            "doc_path": "/tmp",  # Use a safe path
+            "report_type": "research_report"
+        }),
+        return_exceptions=True,
+    )
+    
+    # Test basic research
+    lines.append("\n1. Testing basic research...")
+    if isinstance(web_result, BaseException):
+        lines.append(f"❌ Research failed with exception: {web_result}")
+    else:
+        result_data = _decode(web_result) or {}
         
-        # Test local document research
-        print("\n2. Testing local document research...")
-        try:
-            result = await client.call_tool("research_local_documents", {
-                "query": "Test query",
-                "doc_path": "/tmp",  # Use a safe path
-                "report_type": "research_report"
-            })
-            
-            result_text = result.content[0].text if result.content else "No content"
-            result_data = json.loads(result_text)
-            
-            if result_data.get("success"):
-                print("✅ Local document research completed!")
-            else:
-                print("❌ Local document research failed")
-                print(f"   Error: {result_data.get('error', 'Unknown error')}")
-                
-        except Exception as e:
-            print(f"❌ Local document research failed with exception: {e}")
+        if result_data.get("success"):
+            lines.append("✅ Research completed successfully!")
+            lines.append(f"   Query: {result_data.get('query', 'N/A')}")
+            lines.append(f"   Report length: {result_data.get('report_length', 0)} characters")
+            lines.append(f"   Citations: {result_data.get('citation_count', 0)} sources")
+        else:
+            lines.append("❌ Research failed")
+            lines.append(f"   Error: {result_data.get('error', 'Unknown error')}")
+    
+    # Test local document research
+    lines.append("\n2. Testing local document research...")
+    if isinstance(local_result, BaseException):
+        lines.append(f"❌ Local document research failed with exception: {local_result}")
+    else:
+        result_data = _decode(local_result) or {}
+        
+        if result_data.get("success"):
+            lines.append("✅ Local document research completed!")
+        else:
+            lines.append("❌ Local document research failed")
+            lines.append(f"   Error: {result_data.get('error', 'Unknown error')}")
+    
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
-async def demo_resources():
+async def demo_resources(client):
     """Demonstrate accessing resources"""
+    lines = ["\n📚 Resources Demo"]
+    lines.append("=" * 50)
     
-    print("\n📚 Resources Demo")
-    print("=" * 50)
+    # Both docs resources are static, so fetch them concurrently
+    docs_result, examples_result = await asyncio.gather(
+        cached_read(client, "gpt-researcher://docs/installation"),
+        cached_read(client, "gpt-researcher://docs/examples"),
+        return_exceptions=True,
+    )
     
-    async with Client(mcp) as client:
-        # Get installation docs
-        print("\n1. Getting installation documentation...")
-        try:
-            docs_result = await client.read_resource("gpt-researcher://docs/installation")
-            docs_content = docs_result.contents[0].text if docs_result.contents else "No content"
-            print("✅ Installation docs retrieved!")
-            print(f"   Content preview: {docs_content[:200]}...")
-        except Exception as e:
-            print(f"❌ Failed to get installation docs: {e}")
-        
-        # Get usage examples
-        print("\n2. Getting usage examples...")
-        try:
-            examples_result = await client.read_resource("gpt-researcher://docs/examples")
-            examples_content = examples_result.contents[0].text if examples_result.contents else "No content"
-            print("✅ Usage examples retrieved!")
-            print(f"   Content preview: {examples_content[:200]}...")
-        except Exception as e:
-            print(f"❌ Failed to get usage examples: {e}")
+    # Get installation docs
+    lines.append("\n1. Getting installation documentation...")
+    if isinstance(docs_result, BaseException):
+        lines.append(f"❌ Failed to get installation docs: {docs_result}")
+    else:
+        docs_content = docs_result[0].text if docs_result else "No content"
+        lines.append("✅ Installation docs retrieved!")
+        lines.append(f"   Content preview: {docs_content[:200]}...")
+    
+    # Get usage examples
+    lines.append("\n2. Getting usage examples...")
+    if isinstance(examples_result, BaseException):
+        lines.append(f"❌ Failed to get usage examples: {examples_result}")
+    else:
+        examples_content = examples_result[0].text if examples_result else "No content"
+        lines.append("✅ Usage examples retrieved!")
+        lines.append(f"   Content preview: {examples_content[:200]}...")
+    
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
-async def demo_prompts():
+async def demo_prompts(client):
     """Demonstrate using prompts"""
+    lines = ["\n💡 Prompts Demo"]
+    lines.append("=" * 50)
     
-    print("\n💡 Prompts Demo")
-    print("=" * 50)
+    # Test research outline prompt
+    lines.append("\n1. Testing research outline prompt...")
+    try:
+        prompt_result = await client.get_prompt("research-outline", {
+            "topic": "Machine Learning in Healthcare"
+        })
+        
+        if prompt_result.messages:
+            lines.append("✅ Research outline prompt generated!")
+            lines.append(f"   Prompt: {prompt_result.messages[0].content.text[:200]}...")
+        else:
+            lines.append("❌ No prompt content generated")
+            
+    except Exception as e:
+        lines.append(f"❌ Failed to generate research outline prompt: {e}")
     
-    async with Client(mcp) as client:
-        # Test research outline prompt
-        print("\n1. Testing research outline prompt...")
+    sys.stdout.write("\n".join(lines) + "\n")
+
+
+class _DemosAborted(Exception):
+    """Raised inside the task group once MAX_DEMO_FAILURES sections have failed"""
+
+
+async def run_demos(client, demos):
+    """
+    Run the demos concurrently; returns (failures, aborted).
+    
+    failures lists (demo name, exception) pairs. On Python 3.11+ the demos run in
+    a TaskGroup and the remaining ones are cancelled once MAX_DEMO_FAILURES have
+    failed, which sets aborted. asyncio.gather can't cancel its siblings, so on
+    3.10 every demo runs to completion and aborted is always False.
+    """
+    failures = []
+    
+    async def run_demo(demo, abort):
         try:
-            prompt_result = await client.get_prompt("research-outline", {
-                "topic": "Machine Learning in Healthcare"
-            })
-            
-            if prompt_result.messages:
-                print("✅ Research outline prompt generated!")
-                print(f"   Prompt: {prompt_result.messages[0].content.text[:200]}...")
-            else:
-                print("❌ No prompt content generated")
-                
+            await demo(client)
         except Exception as e:
-            print(f"❌ Failed to generate research outline prompt: {e}")
+            failures.append((demo.__name__, e))
+            if abort and len(failures) >= MAX_DEMO_FAILURES:
+                raise _DemosAborted from e
+    
+    if sys.version_info >= (3, 11):
+        try:
+            async with asyncio.TaskGroup() as tg:
+                for demo in demos:
+                    tg.create_task(run_demo(demo, abort=True))
+        except Exception:
+            # Only _DemosAborted escapes run_demo
+            return failures, True
+        return failures, False
+    
+    await asyncio.gather(*(run_demo(demo, abort=False) for demo in demos))
+    return failures, False
 
 
 async def main():
@@ -198,12 +370,26 @@ async def main():
     print("🎯 GPT Researcher MCP Server - Complete Demo")
     print("=" * 60)
     
-    # Run all demo functions
-    await demo_basic_functionality()
-    await demo_capabilities_check()
-    await demo_research_tools()
-    await demo_resources()
-    await demo_prompts()
+    demos = (
+        demo_basic_functionality,
+        demo_capabilities_check,
+        demo_research_tools,
+        demo_resources,
+        demo_prompts,
+    )
+    
+    # Run all demo functions concurrently over a single shared session. Each
+    # section buffers its own output, but the sections finish, and so print,
+    # in whatever order their calls complete. On Python 3.11+ the run stops
+    # once MAX_DEMO_FAILURES sections have failed.
+    async with Client(mcp) as client:
+        failures, aborted = await run_demos(client, demos)
+    
+    for name, error in failures:
+        print(f"\n❌ {name} failed: {error}")
+    if aborted:
+        print("🛑 Aborting remaining demos (checkpoint)")
+        return
     
     print("\n" + "=" * 60)
     print("🎉 Demo completed!")
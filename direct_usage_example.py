@@ -9,6 +9,7 @@ import asyncio
 import json
 from gpt_researcher_mcp import mcp
 from fastmcp.client import Client
+from demo_usage import _WEB_RESEARCH_ARGS, batch, cached_list, tool_text
 
 
 async def direct_usage_example():
@@ -19,47 +20,51 @@ async def direct_usage_example():
         print("🔍 Testing GPT Researcher MCP Server")
         print("=" * 50)
         
+        # Tests 1-3 are independent, so send them as a single batch
+        capabilities, validation, research = await batch(client, [
+            {"tool": "get_research_capabilities", "arguments": {}},
+            {"tool": "validate_research_setup", "arguments": {}},
+            {"tool": "conduct_research", "arguments": {
+                **_WEB_RESEARCH_ARGS,
+                "query": "What is artificial intelligence?"
+            }},
+        ])
+        
         # Test 1: Get capabilities
         print("\n1. Getting research capabilities...")
-        capabilities_result = await client.call_tool("get_research_capabilities", {})
-        capabilities = capabilities_result.content[0].text if capabilities_result.content else "No content"
         print(f"✓ Capabilities: {capabilities}")
         
         # Test 2: Validate setup
         print("\n2. Validating setup...")
-        validation_result = await client.call_tool("validate_research_setup", {})
-        validation = validation_result.content[0].text if validation_result.content else "No content"
         print(f"✓ Setup validation: {validation}")
         
         # Test 3: Conduct basic research (if GPT Researcher is installed)
         print("\n3. Conducting basic research...")
-        try:
-            research_result = await client.call_tool("conduct_research", {
-                "query": "What is artificial intelligence?",
-                "report_type": "research_report",
-                "report_source": "web",
-                "max_iterations": 1
-            })
-            research_text = research_result.content[0].text if research_result.content else "No content"
-            print(f"✓ Research result: {research_text[:200]}...")
-        except Exception as e:
-            print(f"⚠️  Research failed (likely due to missing GPT Researcher): {e}")
+        if research and research.get("success"):
+            print(f"✓ Research result: {str(research)[:200]}...")
+        else:
+            error = (research or {}).get("error", "No content")
+            print(f"⚠️  Research failed (likely due to missing GPT Researcher): {error}")
+        
+        # Tests 4-6 only read server metadata, so fetch it concurrently
+        tools, resources, prompts = await asyncio.gather(
+            cached_list(client, "tools"),
+            cached_list(client, "resources"),
+            cached_list(client, "prompts"),
+        )
         
         # Test 4: List available tools
         print("\n4. Available tools:")
-        tools = await client.list_tools()
         for tool in tools:
             print(f"  - {tool.name}: {tool.description}")
         
         # Test 5: List available resources
         print("\n5. Available resources:")
-        resources = await client.list_resources()
         for resource in resources:
             print(f"  - {resource.uri}: {resource.name}")
         
         # Test 6: List available prompts
         print("\n6. Available prompts:")
-        prompts = await client.list_prompts()
         for prompt in prompts:
             print(f"  - {prompt.name}: {prompt.description}")
 
@@ -75,14 +80,13 @@ async def research_example():
         # and API keys are configured
         try:
             result = await client.call_tool("conduct_research", {
+                **_WEB_RESEARCH_ARGS,
                 "query": "Latest trends in machine learning",
-                "report_type": "research_report",
-                "report_source": "web",
                 "max_iterations": 2
             })
             
             print("Research completed!")
-            result_text = result.content[0].text if result.content else "No content"
+            result_text = tool_text(result) or "No content"
             print(f"Result: {result_text[:300]}...")
                 
         except Exception as e:
@@ -3,85 +3,136 @@ Example usage of the GPT Researcher MCP Server
 
 This script demonstrates how to use the GPT Researcher MCP server
 for various research tasks.
+
+The research tools (conduct_research, research_local_documents, deep_research,
+hybrid_research_with_mcp) are coroutines, so the examples await them directly on
+this script's loop. get_research_capabilities and validate_research_setup are
+plain synchronous functions.
 """
 
 import asyncio
 import json
+import sys
 from gpt_researcher_mcp import mcp
 
+# validate_research_setup result, fetched once per process by _missing_api_keys
+_SETUP = {}
+
+
+def _missing_api_keys(*keys):
+    """Return the names in keys that validate_research_setup reports as unset"""
+    if not _SETUP:
+        from gpt_researcher_mcp import validate_research_setup
+        _SETUP.update(validate_research_setup.fn()["validation_results"])
+    configured = _SETUP["api_keys_configured"]
+    return [key for key in keys if not configured.get(key)]
+
 
 async def example_basic_research():
     """Example of basic web research"""
-    print("=== Basic Web Research Example ===")
+    lines = ["\n=== Basic Web Research Example ==="]
+    
+    missing = _missing_api_keys("OPENAI_API_KEY", "TAVILY_API_KEY")
+    if missing:
+        lines.append(f"Skipping: missing {', '.join(missing)}")
+        sys.stdout.write("\n".join(lines) + "\n")
+        return
     
     # This would be called through the MCP protocol in practice
     # Here we're showing the tool function directly
     from gpt_researcher_mcp import conduct_research
     
-    result = conduct_research(
+    result = await conduct_research.fn(
         query="What are the latest trends in artificial intelligence research?",
         report_type="research_report",
         report_source="web",
-        max_iterations=3
+        max_iterations=3,
+        summary_only=True
     )
     
-    print(f"Research Query: {result['query']}")
-    print(f"Success: {result['success']}")
+    lines.append(f"Research Query: {result['query']}")
+    lines.append(f"Success: {result['success']}")
     if result['success']:
-        print(f"Report Length: {len(result['report'])} characters")
-        print(f"Citations: {len(result['citations'])} sources")
-        print(f"Metadata: {json.dumps(result['metadata'], indent=2)}")
+        lines.append(f"Report Length: {result['report_length']} characters")
+        lines.append(f"Citations: {result['citation_count']} sources")
+        lines.append(f"Metadata: {json.dumps(result['metadata'], indent=2)}")
     else:
-        print(f"Error: {result['error']}")
+        lines.append(f"Error: {result['error']}")
+    
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 async def example_local_document_research():
     """Example of local document research"""
-    print("\n=== Local Document Research Example ===")
+    lines = ["\n=== Local Document Research Example ==="]
+    
+    missing = _missing_api_keys("OPENAI_API_KEY")
+    if missing:
+        lines.append(f"Skipping: missing {', '.join(missing)}")
+        sys.stdout.write("\n".join(lines) + "\n")
+        return
     
     from gpt_researcher_mcp import research_local_documents
     
-    result = research_local_documents(
+    result = await research_local_documents.fn(
         query="What are the main findings in our quarterly reports?",
         doc_path="./documents",  # Path to your documents
-        report_type="research_report"
+        report_type="research_report",
+        summary_only=True
     )
     
-    print(f"Research Query: {result['query']}")
-    print(f"Success: {result['success']}")
+    lines.append(f"Research Query: {result['query']}")
+    lines.append(f"Success: {result['success']}")
     if result['success']:
-        print(f"Report Length: {len(result['report'])} characters")
-        print(f"Sources: {len(result['citations'])} documents")
+        lines.append(f"Report Length: {result['report_length']} characters")
+        lines.append(f"Sources: {result['citation_count']} documents")
     else:
-        print(f"Error: {result['error']}")
+        lines.append(f"Error: {result['error']}")
+    
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 async def example_deep_research():
     """Example of deep recursive research"""
-    print("\n=== Deep Research Example ===")
+    lines = ["\n=== Deep Research Example ==="]
+    
+    missing = _missing_api_keys("OPENAI_API_KEY", "TAVILY_API_KEY")
+    if missing:
+        lines.append(f"Skipping: missing {', '.join(missing)}")
+        sys.stdout.write("\n".join(lines) + "\n")
+        return
     
     from gpt_researcher_mcp import deep_research
     
-    result = deep_research(
+    result = await deep_research.fn(
         query="Impact of climate change on global agriculture",
         depth=3,
         breadth=5,
-        max_iterations=5
+        max_iterations=5,
+        summary_only=True
     )
     
-    print(f"Research Query: {result['query']}")
-    print(f"Success: {result['success']}")
+    lines.append(f"Research Query: {result['query']}")
+    lines.append(f"Success: {result['success']}")
     if result['success']:
-        print(f"Report Length: {len(result['report'])} characters")
-        print(f"Sources: {len(result['citations'])} sources")
-        print(f"Subtopics Explored: {result['metadata'].get('subtopics_explored', 0)}")
+        lines.append(f"Report Length: {result['report_length']} characters")
+        lines.append(f"Sources: {result['citation_count']} sources")
+        lines.append(f"Subtopics Explored: {result['metadata'].get('subtopics_explored', 0)}")
     else:
-        print(f"Error: {result['error']}")
+        lines.append(f"Error: {result['error']}")
+    
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 async def example_hybrid_research():
     """Example of hybrid research with MCP integration"""
-    print("\n=== Hybrid Research with MCP Example ===")
+    lines = ["\n=== Hybrid Research with MCP Example ==="]
+    
+    missing = _missing_api_keys("OPENAI_API_KEY", "TAVILY_API_KEY")
+    if missing:
+        lines.append(f"Skipping: missing {', '.join(missing)}")
+        sys.stdout.write("\n".join(lines) + "\n")
+        return
     
     from gpt_researcher_mcp import hybrid_research_with_mcp
     
@@ -94,36 +145,41 @@ async def example_hybrid_research():
         }
     ]
     
-    result = hybrid_research_with_mcp(
+    result = await hybrid_research_with_mcp.fn(
         query="Popular open source AI research projects",
         mcp_configs=mcp_configs,
-        report_type="research_report"
+        report_type="research_report",
+        summary_only=True
     )
     
-    print(f"Research Query: {result['query']}")
-    print(f"Success: {result['success']}")
+    lines.append(f"Research Query: {result['query']}")
+    lines.append(f"Success: {result['success']}")
     if result['success']:
-        print(f"Report Length: {len(result['report'])} characters")
-        print(f"Sources: {len(result['citations'])} sources")
+        lines.append(f"Report Length: {result['report_length']} characters")
+        lines.append(f"Sources: {result['citation_count']} sources")
     else:
-        print(f"Error: {result['error']}")
+        lines.append(f"Error: {result['error']}")
+    
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 async def example_capabilities_check():
     """Example of checking capabilities and setup"""
-    print("\n=== Capabilities and Setup Check ===")
+    lines = ["\n=== Capabilities and Setup Check ==="]
     
     from gpt_researcher_mcp import get_research_capabilities, validate_research_setup
     
     # Check capabilities
-    capabilities = get_research_capabilities()
-    print("Capabilities:")
-    print(json.dumps(capabilities, indent=2))
+    capabilities = get_research_capabilities.fn()
+    lines.append("Capabilities:")
+    lines.append(json.dumps(capabilities, indent=2))
     
     # Validate setup
-    validation = validate_research_setup()
-    print("\nSetup Validation:")
-    print(json.dumps(validation, indent=2))
+    validation = validate_research_setup.fn()
+    lines.append("\nSetup Validation:")
+    lines.append(json.dumps(validation, indent=2))
+    
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 async def main():
@@ -131,12 +187,31 @@ async def main():
     print("GPT Researcher MCP Server Examples")
     print("=" * 50)
     
-    # Run examples
-    await example_capabilities_check()
-    await example_basic_research()
-    await example_local_document_research()
-    await example_deep_research()
-    await example_hybrid_research()
+    # The examples are independent, so run them concurrently. Each one
+    # buffers its own output so sections don't interleave on the console.
+    examples = (
+        example_capabilities_check,
+        example_basic_research,
+        example_local_document_research,
+        example_deep_research,
+        example_hybrid_research,
+    )
+    if sys.version_info >= (3, 11):
+        # A failing example cancels the others rather than leaking them
+        try:
+            async with asyncio.TaskGroup() as tg:
+                for example in examples:
+                    tg.create_task(example())
+        except Exception as group:
+            for error in group.exceptions:
+                print(f"\nExample failed: {error}")
+    else:
+        results = await asyncio.gather(
+            *(example() for example in examples), return_exceptions=True
+        )
+        for example, result in zip(examples, results):
+            if isinstance(result, Exception):
+                print(f"\n{example.__name__} failed: {result}")
     
     print("\n" + "=" * 50)
     print("Examples completed!")
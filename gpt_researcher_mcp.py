@@ -11,18 +11,169 @@ import asyncio
 import json
 import os
 import tempfile
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from contextlib import contextmanager
+from functools import lru_cache
+from importlib.util import find_spec
 from pathlib import Path
-from typing import Any, Dict, List, Literal, Optional, Union
+from typing import Any, Awaitable, Callable, Dict, List, Literal, Optional, Union
 
-from fastmcp import FastMCP
-from pydantic import BaseModel, Field
+from fastmcp import Context, FastMCP
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter, ValidationError
+
+# GPT Researcher is optional; the tools report how to install it when it is missing
+try:
+    from gpt_researcher import GPTResearcher as _GPTResearcher
+except ImportError:
+    _GPTResearcher = None
+
+_NOT_INSTALLED_ERROR = "GPT Researcher not installed. Install with: pip install gpt-researcher"
 
 # Create the MCP server
 mcp = FastMCP("GPT Researcher MCP Server")
 
+# Number of report characters included in a summary_only response
+REPORT_PREVIEW_CHARS = 200
+
+# Full reports kept for gpt-researcher://reports/{report_id} (oldest evicted first)
+MAX_STORED_REPORTS = 32
+_REPORTS: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+
+
+class _RequestPacer:
+    """Async context manager that spaces out entries to at most `per_minute` a minute"""
+    
+    def __init__(self, per_minute: int):
+        self._interval = 60.0 / max(1, per_minute)
+        self._next_start = 0.0
+        self._lock = asyncio.Lock()
+    
+    async def __aenter__(self):
+        async with self._lock:
+            now = time.monotonic()
+            start = max(now, self._next_start)
+            self._next_start = start + self._interval
+        if start > now:
+            await asyncio.sleep(start - now)
+    
+    async def __aexit__(self, *exc_info):
+        return False
+
+
+# Upstream throughput limits shared by every research call in this process
+RESEARCH_MAX_CONCURRENCY = int(os.getenv("RESEARCH_MAX_CONCURRENCY", "16"))
+RESEARCH_QPM = int(os.getenv("RESEARCH_QPM", "500"))
+_RESEARCH_SLOTS = asyncio.Semaphore(RESEARCH_MAX_CONCURRENCY)
+_RESEARCH_PACER = _RequestPacer(RESEARCH_QPM)
+
+# Seconds a research run may take, once it has a slot, before it is abandoned
+RESEARCH_TIMEOUT = float(os.getenv("RESEARCH_TIMEOUT", "300"))
+
+
+# Successful research results keyed by _research_key, reused until they expire
+RESEARCH_CACHE_TTL = int(os.getenv("RESEARCH_CACHE_TTL", "3600"))
+RESEARCH_CACHE_SIZE = 512
+_RESEARCH_CACHE: "OrderedDict[tuple, tuple]" = OrderedDict()
+
+# Lookup counters for _RESEARCH_CACHE, reported by get_cache_stats
+_CACHE_STATS = {"hits": 0, "misses": 0}
+
+
+def _research_key(query: str, *options: Any) -> tuple:
+    """Cache key for a research call: the normalized query plus every option that shapes the report"""
+    return (query.strip().lower(),) + tuple(
+        json.dumps(option, sort_keys=True) if isinstance(option, (list, dict)) else option
+        for option in options
+    )
+
+
+def _cache_get(key: tuple) -> Optional[Dict[str, Any]]:
+    """Return the cached result for key, or None if it is missing or expired"""
+    entry = _RESEARCH_CACHE.get(key)
+    if entry is None:
+        _CACHE_STATS["misses"] += 1
+        return None
+    expires, result = entry
+    if expires <= time.monotonic():
+        del _RESEARCH_CACHE[key]
+        _CACHE_STATS["misses"] += 1
+        return None
+    _RESEARCH_CACHE.move_to_end(key)
+    _CACHE_STATS["hits"] += 1
+    return result
+
+
+def _cache_put(key: tuple, result: Dict[str, Any]) -> None:
+    """Store a successful result, evicting the least recently used entries past the size limit"""
+    if RESEARCH_CACHE_TTL <= 0 or not result.get("success"):
+        return
+    _RESEARCH_CACHE[key] = (time.monotonic() + RESEARCH_CACHE_TTL, result)
+    _RESEARCH_CACHE.move_to_end(key)
+    while len(_RESEARCH_CACHE) > RESEARCH_CACHE_SIZE:
+        _RESEARCH_CACHE.popitem(last=False)
+
+
+# Research runs currently in flight, keyed like _RESEARCH_CACHE, as
+# [task, number of callers awaiting it]; identical calls share one task
+_INFLIGHT: Dict[tuple, list] = {}
+
+
+async def _single_flight(
+    key: tuple,
+    query: str,
+    run: Callable[[], Awaitable[Dict[str, Any]]],
+    cache: bool = True
+) -> Dict[str, Any]:
+    """
+    Return the cached result for key, or await one shared run of run().
+    
+    The run is a detached task, so a caller that is cancelled only stops
+    waiting; the task itself is cancelled once no callers are left. With cache
+    set, results are looked up in and stored to _RESEARCH_CACHE. Every caller
+    gets its own shallow copy carrying the query exactly as it asked it.
+    """
+    result = _cache_get(key) if cache else None
+    if result is None:
+        entry = _INFLIGHT.get(key)
+        if entry is None:
+            task = asyncio.get_running_loop().create_task(run())
+            entry = _INFLIGHT[key] = [task, 0]
+            
+            def finish(task: asyncio.Task) -> None:
+                if _INFLIGHT.get(key) is entry:
+                    del _INFLIGHT[key]
+                if cache and not task.cancelled() and task.exception() is None:
+                    _cache_put(key, task.result())
+            
+            task.add_done_callback(finish)
+        
+        task = entry[0]
+        entry[1] += 1
+        try:
+            result = await asyncio.shield(task)
+        finally:
+            entry[1] -= 1
+            if entry[1] == 0 and not task.done():
+                # Unlist the run before cancelling it, so a call arriving while
+                # it winds down starts a fresh run instead of joining this one
+                if _INFLIGHT.get(key) is entry:
+                    del _INFLIGHT[key]
+                task.cancel()
+    
+    # Keys normalize the query's case and spacing, so echo the caller's own
+    result = {**result, "query": query}
+    if "query" in result["metadata"]:
+        result["metadata"] = {**result["metadata"], "query": query}
+    return result
+
 
 class ResearchConfig(BaseModel):
     """Configuration for GPT Researcher"""
+    model_config = ConfigDict(frozen=True, extra="forbid")
+    
     query: str = Field(..., description="The research query or topic")
     report_type: Literal["research_report", "resource_report", "outline_report"] = Field(
         default="research_report", 
@@ -52,8 +203,25 @@ class ResearchConfig(BaseModel):
     )
 
 
+class LocalResearchConfig(ResearchConfig):
+    """Configuration for research restricted to local documents"""
+    report_source: Literal["local"] = "local"
+    retriever: Literal["local"] = "local"
+    doc_path: str = Field(..., description="Path to local documents directory")
+
+
+class HybridResearchConfig(ResearchConfig):
+    """Configuration for web research combined with MCP data sources"""
+    retriever: str = "tavily,mcp"
+    mcp_configs: List[Dict[str, Any]] = Field(
+        ..., description="MCP configurations for the external data sources"
+    )
+
+
 class ResearchResult(BaseModel):
     """Result of a research operation"""
+    model_config = ConfigDict(frozen=True, extra="forbid")
+    
     query: str
     report: str
     citations: List[str]
@@ -62,15 +230,214 @@ class ResearchResult(BaseModel):
     error: Optional[str] = None
 
 
+# Serializes _env_override so concurrent calls never see each other's settings
+_ENV_LOCK = threading.Lock()
+
+
+@contextmanager
+def _env_override(overrides: Dict[str, Optional[str]]):
+    """Temporarily set environment variables (None or empty values are skipped)"""
+    overrides = {name: value for name, value in overrides.items() if value}
+    with _ENV_LOCK:
+        saved = {name: os.environ.get(name) for name in overrides}
+        os.environ.update(overrides)
+        try:
+            yield
+        finally:
+            for name, value in saved.items():
+                if value is None:
+                    os.environ.pop(name, None)
+                else:
+                    os.environ[name] = value
+
+
+# Stages reported by _report_progress: gathering sources, writing, done
+RESEARCH_PROGRESS_STEPS = 2
+
+
+async def _report_progress(ctx: Optional[Context], step: int, message: str) -> None:
+    """Send a progress notification for a research stage when called through MCP"""
+    if ctx is None:
+        return
+    try:
+        await ctx.report_progress(step, RESEARCH_PROGRESS_STEPS, message)
+    except Exception:
+        # The run is shared, so the caller that started it may already be gone;
+        # progress is best effort and must not fail the research
+        pass
+
+
+async def _research_steps(researcher: Any, conduct, ctx: Optional[Context]) -> tuple:
+    """
+    Run conduct(), then write the report while fetching the timestamp.
+    
+    Returns (research_result, report, timestamp), reporting progress along the way.
+    """
+    await _report_progress(ctx, 0, "Gathering sources")
+    research_result = await conduct()
+    await _report_progress(ctx, 1, "Writing report")
+    report, timestamp = await asyncio.gather(
+        researcher.write_report(),
+        researcher.get_timestamp()
+    )
+    await _report_progress(ctx, 2, "Report complete")
+    return research_result, report, timestamp
+
+
+def _failed_result(query: str, error: str) -> Dict[str, Any]:
+    """Result envelope for a research call that produced no report"""
+    return {
+        "success": False,
+        "query": query,
+        "report": "",
+        "citations": [],
+        "metadata": {},
+        "error": error
+    }
+
+
+async def _execute_research(
+    query: str,
+    label: str,
+    create: Callable[[], Any],
+    conduct: str,
+    describe: Callable[[Any, Any, List[Any]], Dict[str, Any]],
+    ctx: Optional[Context]
+) -> Dict[str, Any]:
+    """
+    Create a researcher, run its conduct method and write the report.
+    
+    describe(research_result, timestamp, citations) builds the metadata. Failures
+    and runs past RESEARCH_TIMEOUT are returned as failed results prefixed with label.
+    """
+    try:
+        researcher = create()
+        async with _RESEARCH_SLOTS, _RESEARCH_PACER:
+            research_result, report, timestamp = await asyncio.wait_for(
+                _research_steps(researcher, getattr(researcher, conduct), ctx),
+                RESEARCH_TIMEOUT
+            )
+        
+        citations = getattr(research_result, 'citations', [])
+        return {
+            "success": True,
+            "query": query,
+            "report": report,
+            "citations": citations,
+            "metadata": describe(research_result, timestamp, citations),
+            "error": None
+        }
+    except asyncio.TimeoutError:
+        return _failed_result(query, f"{label} timed out after {RESEARCH_TIMEOUT:g} seconds")
+    except Exception as e:
+        return _failed_result(query, f"{label} failed: {str(e)}")
+
+
+# Validators for tool arguments, built once and reused by every call
+_RC_ADAPTER = TypeAdapter(ResearchConfig)
+_LOCAL_RC_ADAPTER = TypeAdapter(LocalResearchConfig)
+_HYBRID_RC_ADAPTER = TypeAdapter(HybridResearchConfig)
+
+
+def _summarize(result: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Replace the report and citations of a research result with a compact envelope.
+    
+    Successful reports are kept in memory and can be fetched in full from the
+    gpt-researcher://reports/{report_id} resource.
+    """
+    summary = dict(result)
+    report = summary.pop("report", "")
+    citations = summary.pop("citations", [])
+    summary.update(
+        report_length=len(report),
+        citation_count=len(citations),
+        report_preview=report[:REPORT_PREVIEW_CHARS],
+        report_id=None,
+    )
+    
+    if summary.get("success"):
+        report_id = uuid.uuid4().hex
+        _REPORTS[report_id] = {"report": report, "citations": citations}
+        while len(_REPORTS) > MAX_STORED_REPORTS:
+            _REPORTS.popitem(last=False)
+        summary["report_id"] = report_id
+    
+    return summary
+
+
+async def _run_research(cfg: ResearchConfig, ctx: Optional[Context] = None) -> Dict[str, Any]:
+    """
+    Run GPT Researcher for a validated configuration and return the full result.
+    
+    Successful results are cached, and identical calls made while one is running
+    share its result.
+    """
+    if _GPTResearcher is None:
+        return _failed_result(cfg.query, _NOT_INSTALLED_ERROR)
+    
+    def create():
+        # GPT Researcher reads DOC_PATH and RETRIEVER into its config when the
+        # researcher is created, so they only need to be set for construction
+        with _env_override({"DOC_PATH": cfg.doc_path, "RETRIEVER": cfg.retriever}):
+            return _GPTResearcher(
+                query=cfg.query,
+                report_type=cfg.report_type,
+                report_source=cfg.report_source,
+                mcp_configs=cfg.mcp_configs or []
+            )
+    
+    def describe(research_result, timestamp, citations):
+        return {
+            "query": cfg.query,
+            "report_type": cfg.report_type,
+            "report_source": cfg.report_source,
+            "max_iterations": cfg.max_iterations,
+            "retriever": cfg.retriever,
+            "timestamp": timestamp,
+            "research_steps": getattr(research_result, 'research_steps', []),
+            "total_sources": len(citations)
+        }
+    
+    key = _research_key(
+        cfg.query, cfg.report_type, cfg.report_source, cfg.retriever,
+        cfg.max_iterations, cfg.doc_path, cfg.mcp_configs
+    )
+    # Reports built from local documents aren't cached, since the documents can
+    # change at any time; identical calls still share a run
+    return await _single_flight(key, cfg.query, lambda: _execute_research(
+        cfg.query, "Research", create, "conduct_research", describe, ctx
+    ), cache=cfg.doc_path is None)
+
+
+async def _research_response(
+    adapter: TypeAdapter,
+    fields: Dict[str, Any],
+    summary_only: bool,
+    ctx: Optional[Context]
+) -> Dict[str, Any]:
+    """Validate tool arguments with adapter, run the research and shape the response"""
+    try:
+        cfg = adapter.validate_python(fields)
+    except ValidationError as e:
+        result = _failed_result(fields["query"], f"Invalid research configuration: {e}")
+    else:
+        result = await _run_research(cfg, ctx)
+    
+    return _summarize(result) if summary_only else result
+
+
 @mcp.tool
-def conduct_research(
+async def conduct_research(
     query: str,
     report_type: Literal["research_report", "resource_report", "outline_report"] = "research_report",
     report_source: Literal["web", "local", "hybrid"] = "web",
     max_iterations: int = 3,
     doc_path: Optional[str] = None,
     retriever: str = "tavily",
-    mcp_configs: Optional[List[Dict[str, Any]]] = None
+    mcp_configs: Optional[List[Dict[str, Any]]] = None,
+    summary_only: bool = False,
+    ctx: Optional[Context] = None
 ) -> Dict[str, Any]:
     """
     Conduct comprehensive research on a given query using GPT Researcher.
@@ -86,82 +453,31 @@ def conduct_research(
         doc_path: Path to local documents directory (required for local/hybrid research)
         retriever: Retriever to use (tavily, mcp, or comma-separated list)
         mcp_configs: MCP configurations for hybrid research with external data sources
+        summary_only: Return report_length, citation_count and report_preview instead of
+            the full report; the full text is available from gpt-researcher://reports/{report_id}
+        ctx: Request context, injected by FastMCP, used to send progress notifications
     
     Returns:
         Dictionary containing the research report, citations, and metadata
     """
-    try:
-        # Import GPT Researcher
-        from gpt_researcher import GPTResearcher
-        
-        # Set up environment variables if needed
-        if doc_path:
-            os.environ["DOC_PATH"] = doc_path
-        
-        if retriever:
-            os.environ["RETRIEVER"] = retriever
-        
-        # Create researcher instance
-        researcher = GPTResearcher(
-            query=query,
-            report_type=report_type,
-            report_source=report_source,
-            mcp_configs=mcp_configs or []
-        )
-        
-        # Conduct research
-        research_result = asyncio.run(researcher.conduct_research())
-        
-        # Write report
-        report = asyncio.run(researcher.write_report())
-        
-        # Extract citations and metadata
-        citations = getattr(research_result, 'citations', [])
-        metadata = {
-            "query": query,
-            "report_type": report_type,
-            "report_source": report_source,
-            "max_iterations": max_iterations,
-            "retriever": retriever,
-            "timestamp": asyncio.run(researcher.get_timestamp()),
-            "research_steps": getattr(research_result, 'research_steps', []),
-            "total_sources": len(citations)
-        }
-        
-        return {
-            "success": True,
-            "query": query,
-            "report": report,
-            "citations": citations,
-            "metadata": metadata,
-            "error": None
-        }
-        
-    except ImportError:
-        return {
-            "success": False,
-            "query": query,
-            "report": "",
-            "citations": [],
-            "metadata": {},
-            "error": "GPT Researcher not installed. Install with: pip install gpt-researcher"
-        }
-    except Exception as e:
-        return {
-            "success": False,
-            "query": query,
-            "report": "",
-            "citations": [],
-            "metadata": {},
-            "error": f"Research failed: {str(e)}"
-        }
+    return await _research_response(_RC_ADAPTER, {
+        "query": query,
+        "report_type": report_type,
+        "report_source": report_source,
+        "max_iterations": max_iterations,
+        "doc_path": doc_path,
+        "retriever": retriever,
+        "mcp_configs": mcp_configs
+    }, summary_only, ctx)
 
 
 @mcp.tool
-def research_local_documents(
+async def research_local_documents(
     query: str,
     doc_path: str,
-    report_type: Literal["research_report", "resource_report", "outline_report"] = "research_report"
+    report_type: Literal["research_report", "resource_report", "outline_report"] = "research_report",
+    summary_only: bool = False,
+    ctx: Optional[Context] = None
 ) -> Dict[str, Any]:
     """
     Conduct research using only local documents.
@@ -173,25 +489,32 @@ def research_local_documents(
         query: The research question or topic
         doc_path: Path to directory containing documents
         report_type: Type of report to generate
+        summary_only: Return a compact summary instead of the full report
+        ctx: Request context, injected by FastMCP, used to send progress notifications
     
     Returns:
         Dictionary containing the research report based on local documents
     """
-    return conduct_research.fn(
-        query=query,
-        report_type=report_type,
-        report_source="local",
-        doc_path=doc_path,
-        retriever="local"
-    )
+    # A missing directory can't yield any documents, so skip the research pipeline
+    if not os.path.isdir(doc_path):
+        result = _failed_result(query, f"Document path not found: {doc_path}")
+        return _summarize(result) if summary_only else result
+    
+    return await _research_response(_LOCAL_RC_ADAPTER, {
+        "query": query,
+        "report_type": report_type,
+        "doc_path": doc_path
+    }, summary_only, ctx)
 
 
 @mcp.tool
-def deep_research(
+async def deep_research(
     query: str,
     depth: int = 3,
     breadth: int = 5,
-    max_iterations: int = 5
+    max_iterations: int = 5,
+    summary_only: bool = False,
+    ctx: Optional[Context] = None
 ) -> Dict[str, Any]:
     """
     Conduct deep recursive research with tree-like exploration.
@@ -205,79 +528,70 @@ def deep_research(
         depth: Depth of recursive exploration (1-5)
         breadth: Breadth of subtopics to explore (1-10)
         max_iterations: Maximum number of research iterations
+        summary_only: Return a compact summary instead of the full report
+        ctx: Request context, injected by FastMCP, used to send progress notifications
     
     Returns:
         Dictionary containing the deep research report with comprehensive analysis
     """
-    try:
-        from gpt_researcher import GPTResearcher
-        
-        # Configure for deep research
-        researcher = GPTResearcher(
-            query=query,
-            report_type="research_report",
-            report_source="web"
+    if not (1 <= depth <= 5 and 1 <= breadth <= 10 and 1 <= max_iterations <= 10):
+        result = _failed_result(
+            query,
+            "Invalid research configuration: depth must be 1-5, breadth 1-10 "
+            f"and max_iterations 1-10 (got {depth}, {breadth}, {max_iterations})"
         )
+        return _summarize(result) if summary_only else result
+    
+    if _GPTResearcher is None:
+        result = _failed_result(query, _NOT_INSTALLED_ERROR)
+        return _summarize(result) if summary_only else result
+    
+    def create():
+        # GPT Researcher gathers each level's subqueries concurrently, up to
+        # DEEP_RESEARCH_CONCURRENCY at a time (read when the researcher is
+        # created); let a whole level of `breadth` subqueries run at once,
+        # within the process-wide concurrency limit
+        concurrency = max(1, min(breadth, RESEARCH_MAX_CONCURRENCY))
+        with _env_override({"DEEP_RESEARCH_CONCURRENCY": str(concurrency)}):
+            researcher = _GPTResearcher(
+                query=query,
+                report_type="research_report",
+                report_source="web"
+            )
         
         # Set deep research parameters
         researcher.depth = depth
         researcher.breadth = breadth
         researcher.max_iterations = max_iterations
-        
-        # Conduct deep research
-        research_result = asyncio.run(researcher.conduct_deep_research())
-        
-        # Write comprehensive report
-        report = asyncio.run(researcher.write_report())
-        
-        # Extract comprehensive metadata
-        citations = getattr(research_result, 'citations', [])
-        metadata = {
+        return researcher
+    
+    def describe(research_result, timestamp, citations):
+        return {
             "query": query,
             "research_type": "deep_research",
             "depth": depth,
             "breadth": breadth,
             "max_iterations": max_iterations,
-            "timestamp": asyncio.run(researcher.get_timestamp()),
+            "timestamp": timestamp,
             "research_tree": getattr(research_result, 'research_tree', {}),
             "total_sources": len(citations),
             "subtopics_explored": getattr(research_result, 'subtopics_count', 0)
         }
-        
-        return {
-            "success": True,
-            "query": query,
-            "report": report,
-            "citations": citations,
-            "metadata": metadata,
-            "error": None
-        }
-        
-    except ImportError:
-        return {
-            "success": False,
-            "query": query,
-            "report": "",
-            "citations": [],
-            "metadata": {},
-            "error": "GPT Researcher not installed. Install with: pip install gpt-researcher"
-        }
-    except Exception as e:
-        return {
-            "success": False,
-            "query": query,
-            "report": "",
-            "citations": [],
-            "metadata": {},
-            "error": f"Deep research failed: {str(e)}"
-        }
+    
+    key = _research_key(query, "deep_research", depth, breadth, max_iterations)
+    result = await _single_flight(key, query, lambda: _execute_research(
+        query, "Deep research", create, "conduct_deep_research", describe, ctx
+    ))
+    return _summarize(result) if summary_only else result
 
 
 @mcp.tool
-def hybrid_research_with_mcp(
+async def hybrid_research_with_mcp(
     query: str,
     mcp_configs: List[Dict[str, Any]],
-    report_type: Literal["research_report", "resource_report", "outline_report"] = "research_report"
+    report_type: Literal["research_report", "resource_report", "outline_report"] = "research_report",
+    summary_only: bool = False,
+    ctx: Optional[Context] = None
 ) -> Dict[str, Any]:
     """
     Conduct hybrid research using both web search and MCP data sources.
@@ -289,17 +603,43 @@ def hybrid_research_with_mcp(
         query: The research question or topic
         mcp_configs: List of MCP configurations for external data sources
         report_type: Type of report to generate
+        summary_only: Return a compact summary instead of the full report
+        ctx: Request context, injected by FastMCP, used to send progress notifications
     
     Returns:
         Dictionary containing the hybrid research report
     """
-    return conduct_research.fn(
-        query=query,
-        report_type=report_type,
-        report_source="web",
-        retriever="tavily,mcp",
-        mcp_configs=mcp_configs
-    )
+    return await _research_response(_HYBRID_RC_ADAPTER, {
+        "query": query,
+        "report_type": report_type,
+        "mcp_configs": mcp_configs
+    }, summary_only, ctx)
+
+
+@lru_cache(maxsize=1)
+def _capabilities_payload() -> Dict[str, Any]:
+    """Capability description returned by get_research_capabilities (built once)"""
+    return {
+        "supported_report_types": ["research_report", "resource_report", "outline_report"],
+        "supported_sources": ["web", "local", "hybrid"],
+        "supported_document_formats": [
+            "PDF", "TXT", "CSV", "Excel", "Markdown", 
+            "PowerPoint", "Word documents"
+        ],
+        "available_retrievers": ["tavily", "mcp", "local"],
+        "deep_research_available": True,
+        "mcp_integration_available": True,
+        "local_document_support": True,
+        "citation_support": True,
+        "multi_agent_support": True,
+        "configuration_options": {
+            "max_iterations": "1-10",
+            "depth": "1-5 (for deep research)",
+            "breadth": "1-10 (for deep research)",
+            "report_types": ["research_report", "resource_report", "outline_report"],
+            "sources": ["web", "local", "hybrid"]
+        }
+    }
 
 
 @mcp.tool
@@ -310,43 +650,22 @@ def get_research_capabilities() -> Dict[str, Any]:
     Returns:
         Dictionary containing available features, supported formats, and configuration options
     """
-    try:
-        from gpt_researcher import GPTResearcher
-        
-        capabilities = {
-            "supported_report_types": ["research_report", "resource_report", "outline_report"],
-            "supported_sources": ["web", "local", "hybrid"],
-            "supported_document_formats": [
-                "PDF", "TXT", "CSV", "Excel", "Markdown", 
-                "PowerPoint", "Word documents"
-            ],
-            "available_retrievers": ["tavily", "mcp", "local"],
-            "deep_research_available": True,
-            "mcp_integration_available": True,
-            "local_document_support": True,
-            "citation_support": True,
-            "multi_agent_support": True,
-            "configuration_options": {
-                "max_iterations": "1-10",
-                "depth": "1-5 (for deep research)",
-                "breadth": "1-10 (for deep research)",
-                "report_types": ["research_report", "resource_report", "outline_report"],
-                "sources": ["web", "local", "hybrid"]
-            }
-        }
-        
-        return {
-            "success": True,
-            "capabilities": capabilities,
-            "error": None
-        }
-        
-    except ImportError:
+    if _GPTResearcher is None:
         return {
             "success": False,
             "capabilities": {},
-            "error": "GPT Researcher not installed. Install with: pip install gpt-researcher"
+            "error": _NOT_INSTALLED_ERROR
         }
+    
+    return {
+        "success": True,
+        "capabilities": _capabilities_payload(),
+        "error": None
+    }
+
+
+# Optional dependencies whose import name differs from their package name
+_IMPORT_NAMES = {"beautifulsoup4": "bs4"}
 
 
 @mcp.tool
@@ -358,16 +677,13 @@ def validate_research_setup() -> Dict[str, Any]:
         Dictionary containing validation results and setup instructions
     """
     validation_results = {
-        "gpt_researcher_installed": False,
+        "gpt_researcher_installed": _GPTResearcher is not None,
         "required_dependencies": {},
         "api_keys_configured": {},
         "setup_instructions": []
     }
     
-    try:
-        import gpt_researcher
-        validation_results["gpt_researcher_installed"] = True
-    except ImportError:
+    if _GPTResearcher is None:
         validation_results["setup_instructions"].append(
             "Install GPT Researcher: pip install gpt-researcher"
         )
@@ -393,12 +709,10 @@ def validate_research_setup() -> Dict[str, Any]:
         "beautifulsoup4": "For web scraping"
     }
     
+    # find_spec only locates each module; nothing is imported or executed
     for dep, description in optional_deps.items():
-        try:
-            __import__(dep)
-            validation_results["required_dependencies"][dep] = True
-        except ImportError:
-            validation_results["required_dependencies"][dep] = False
+        module = _IMPORT_NAMES.get(dep, dep)
+        validation_results["required_dependencies"][dep] = find_spec(module) is not None
     
     return {
         "success": True,
@@ -407,11 +721,100 @@ def validate_research_setup() -> Dict[str, Any]:
     }
 
 
-# Resources for documentation and examples
-@mcp.resource("gpt-researcher://docs/installation")
-def installation_docs() -> str:
-    """Installation and setup documentation for GPT Researcher"""
-    return """
+@mcp.tool
+def clear_research_cache() -> Dict[str, Any]:
+    """
+    Drop every cached research result so the next calls run fresh research.
+    
+    Returns:
+        Dictionary containing the number of cached results that were removed
+    """
+    cleared = len(_RESEARCH_CACHE)
+    _RESEARCH_CACHE.clear()
+    
+    return {
+        "success": True,
+        "cleared": cleared,
+        "error": None
+    }
+
+
+@mcp.tool
+def get_cache_stats() -> Dict[str, Any]:
+    """
+    Report how often research calls were answered from the result cache.
+    
+    Returns:
+        Dictionary containing cache hits, misses, hit rate and current size
+    """
+    hits, misses = _CACHE_STATS["hits"], _CACHE_STATS["misses"]
+    lookups = hits + misses
+    
+    return {
+        "success": True,
+        "hits": hits,
+        "misses": misses,
+        "hit_rate": hits / lookups if lookups else 0.0,
+        "size": len(_RESEARCH_CACHE),
+        "max_size": RESEARCH_CACHE_SIZE,
+        "ttl_seconds": RESEARCH_CACHE_TTL,
+        "error": None
+    }
+
+
+@mcp.tool
+async def batch_execute(
+    operations: List[Dict[str, Any]],
+    max_concurrent: int = 4
+) -> Dict[str, Any]:
+    """
+    Run several tool calls in a single request.
+    
+    Each operation is a dictionary of the form {"tool": name, "arguments": {...}}.
+    Operations run concurrently and each one succeeds or fails independently.
+    
+    Args:
+        operations: Tool calls to run, in order
+        max_concurrent: Maximum number of operations running at the same time
+    
+    Returns:
+        Dictionary containing one result entry per operation, in the same order
+    """
+    semaphore = asyncio.Semaphore(max(1, max_concurrent))
+    
+    async def run_operation(operation: Dict[str, Any]) -> Dict[str, Any]:
+        name = operation.get("tool", "")
+        try:
+            if name == "batch_execute":
+                raise ValueError("batch_execute cannot be nested")
+            async with semaphore:
+                tool = await mcp.get_tool(name)
+                result = await tool.run(operation.get("arguments") or {})
+            return {
+                "tool": name,
+                "success": True,
+                "result": result.structured_content,
+                "error": None
+            }
+        except Exception as e:
+            return {
+                "tool": name,
+                "success": False,
+                "result": None,
+                "error": str(e)
+            }
+    
+    results = await asyncio.gather(*(run_operation(op) for op in operations))
+    
+    return {
+        "success": True,
+        "results": list(results),
+        "error": None
+    }
+
+
+# The documentation and config resources never change, so render them once at import
+_INSTALLATION_DOCS = """
 # GPT Researcher Installation Guide
 
 ## Prerequisites
@@ -430,6 +833,21 @@ export OPENAI_API_KEY="your-openai-api-key"
 export TAVILY_API_KEY="your-tavily-api-key"
 ```
 
+## Optional: Throughput Limits
+Research calls share a concurrency cap and a queries-per-minute pacer:
+```bash
+export RESEARCH_MAX_CONCURRENCY=16  # simultaneous research calls
+export RESEARCH_QPM=500             # research calls started per minute
+export RESEARCH_TIMEOUT=300         # seconds before a research call gives up
+```
+
+Successful results are cached in memory and reused for repeated queries
+(research over local documents is not cached):
+```bash
+export RESEARCH_CACHE_TTL=3600  # seconds; 0 disables the cache
+```
+Use the `get_cache_stats` tool to see the hit rate and `clear_research_cache` to empty it.
+
 ## Optional: MCP Integration
 For hybrid research with external data sources:
 ```bash
@@ -440,11 +858,7 @@ export GITHUB_TOKEN="your-github-token"  # For GitHub MCP server
 Use the `validate_research_setup` tool to check your installation.
 """
 
-
-@mcp.resource("gpt-researcher://docs/examples")
-def usage_examples() -> str:
-    """Usage examples for GPT Researcher MCP tools"""
-    return """
+_USAGE_EXAMPLES = """
 # GPT Researcher MCP Usage Examples
 
 ## Basic Web Research
@@ -489,6 +903,14 @@ result = hybrid_research_with_mcp(
 )
 ```
 
+## Summary Responses
+```python
+# Get report_length, citation_count and report_preview instead of the full text
+summary = conduct_research(query="Quantum computing", summary_only=True)
+# The full report stays available as a resource
+# gpt-researcher://reports/{summary["report_id"]}
+```
+
 ## Configuration Options
 - report_type: "research_report", "resource_report", "outline_report"
 - report_source: "web", "local", "hybrid"
@@ -496,37 +918,61 @@ result = hybrid_research_with_mcp(
 - retriever: "tavily", "mcp", "local", or comma-separated list
 """
 
+_CONFIG_JSON = json.dumps({
+    "research_config": {
+        "default_report_type": "research_report",
+        "default_source": "web",
+        "max_iterations": 3,
+        "retriever": "tavily"
+    },
+    "mcp_configs": [
+        {
+            "name": "github",
+            "command": "npx",
+            "args": ["-y", "@modelcontextprotocol/server-github"],
+            "env": {
+                "GITHUB_TOKEN": "${GITHUB_TOKEN}"
+            }
+        }
+    ],
+    "local_documents": {
+        "doc_path": "./documents",
+        "supported_formats": ["pdf", "txt", "csv", "xlsx", "md", "pptx", "docx"]
+    },
+    "deep_research": {
+        "default_depth": 3,
+        "default_breadth": 5,
+        "max_iterations": 5
+    }
+}, indent=2)
+
+
+# Resources for documentation and examples
+@mcp.resource("gpt-researcher://docs/installation")
+def installation_docs() -> str:
+    """Installation and setup documentation for GPT Researcher"""
+    return _INSTALLATION_DOCS
+
+
+@mcp.resource("gpt-researcher://docs/examples")
+def usage_examples() -> str:
+    """Usage examples for GPT Researcher MCP tools"""
+    return _USAGE_EXAMPLES
+
 
 @mcp.resource("gpt-researcher://config/template")
 def config_template() -> str:
     """Configuration template for GPT Researcher"""
-    return json.dumps({
-        "research_config": {
-            "default_report_type": "research_report",
-            "default_source": "web",
-            "max_iterations": 3,
-            "retriever": "tavily"
-        },
-        "mcp_configs": [
-            {
-                "name": "github",
-                "command": "npx",
-                "args": ["-y", "@modelcontextprotocol/server-github"],
-                "env": {
-                    "GITHUB_TOKEN": "${GITHUB_TOKEN}"
-                }
-            }
-        ],
-        "local_documents": {
-            "doc_path": "./documents",
-            "supported_formats": ["pdf", "txt", "csv", "xlsx", "md", "pptx", "docx"]
-        },
-        "deep_research": {
-            "default_depth": 3,
-            "default_breadth": 5,
-            "max_iterations": 5
-        }
-    }, indent=2)
+    return _CONFIG_JSON
+
+
+@mcp.resource("gpt-researcher://reports/{report_id}")
+def stored_report(report_id: str) -> str:
+    """Full report and citations for a research call made with summary_only=True"""
+    stored = _REPORTS.get(report_id)
+    if stored is None:
+        raise ValueError(f"Unknown or expired report: {report_id}")
+    return json.dumps(stored, indent=2)
 
 
 # Prompts for common research tasks
@@ -568,5 +1014,11 @@ Focus on critical analysis and actionable insights.
 
 
 if __name__ == "__main__":
-    # Run the MCP server
-    mcp.run()
+    # Run the MCP server on uvloop when it is installed
+    try:
+        import uvloop  # noqa: F401
+    except ImportError:
+        mcp.run()
+    else:
+        import anyio
+        anyio.run(mcp.run_async, backend_options={"use_uvloop": True})
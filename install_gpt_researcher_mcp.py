@@ -12,11 +12,11 @@ import sys
 from pathlib import Path
 
 
-def run_command(command, description):
-    """Run a command and handle errors"""
+def run_command(cmd_list, description):
+    """Run a command, given as an argument list, and handle errors"""
     print(f"Running: {description}")
     try:
-        result = subprocess.run(command, shell=True, check=True, capture_output=True, text=True)
+        result = subprocess.run(cmd_list, check=True, capture_output=True, text=True)
         print(f"✓ {description} completed successfully")
         return True
     except subprocess.CalledProcessError as e:
@@ -26,6 +26,10 @@ def run_command(command, description):
         if e.stderr:
             print(f"stderr: {e.stderr}")
         return False
+    except OSError as e:
+        # Without a shell, a missing executable raises instead of exiting 127
+        print(f"✗ {description} failed: {e}")
+        return False
 
 
 def check_python_version():
@@ -48,11 +52,13 @@ def install_dependencies():
         "uvicorn"
     ]
     
-    print("Installing dependencies...")
-    for dep in dependencies:
-        if not run_command(f"pip install {dep}", f"Installing {dep}"):
-            return False
-    return True
+    # One pip run for this interpreter resolves all dependencies together
+    cmd_list = [
+        sys.executable, "-m", "pip", "install",
+        "--no-input", "--disable-pip-version-check",
+        *dependencies
+    ]
+    return run_command(cmd_list, f"Installing {', '.join(dependencies)}")
 
 
 def create_env_file():
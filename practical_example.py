@@ -3,26 +3,156 @@
 A practical FastMCP server example - Personal Assistant
 This demonstrates real-world usage patterns for FastMCP
 """
+import asyncio
+import atexit
 import os
 import json
-import requests
+import logging
+import mmap
 from datetime import datetime
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Tuple
+from urllib.parse import quote
+import httpx
 from fastmcp import FastMCP
 
+try:
+    import orjson
+
+    def _dumps(data: Any, indent: bool = False) -> bytes:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 if indent else 0)
+
+    _loads = orjson.loads
+except ImportError:
+    def _dumps(data: Any, indent: bool = False) -> bytes:
+        return json.dumps(data, indent=2 if indent else None).encode()
+
+    _loads = json.loads
+
+logger = logging.getLogger(__name__)
+
 # Create a personal assistant MCP server
 mcp = FastMCP("Personal Assistant")
 
+# One pooled HTTP client shared by every tool call, closed when the process exits
+_HTTP = httpx.AsyncClient(timeout=10.0, limits=httpx.Limits(max_keepalive_connections=32))
+
+
+@atexit.register
+def _close_http() -> None:
+    if not _HTTP.is_closed:
+        asyncio.run(_HTTP.aclose())
+
+# Todos are persisted as an append-only log: one {"op": "create", "todo": {...}}
+# or {"op": "complete", "index": i} record per line, replayed at startup
+TODOS_LOG = "todos.jsonl"
+
+# Earlier versions kept the whole list in one JSON file; it is imported into
+# the log the first time the server starts without one
+LEGACY_TODOS_FILE = "todos.json"
+
+def _replay(path: str) -> Tuple[List[Dict[str, Any]], int]:
+    """
+    Rebuild the todo list from the log at path; returns (todos, record_count).
+    
+    A crash mid-append leaves a torn last line. It is dropped and the log is
+    truncated to the last whole record, so later appends start on a clean line.
+    """
+    todos = []
+    records = 0
+    torn_at = None
+    try:
+        with open(path, 'rb') as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return todos, records
+            # Map the log instead of reading it into a buffer; lines come
+            # straight from the page cache
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                while True:
+                    offset = mm.tell()
+                    line = mm.readline()
+                    if not line:
+                        break
+                    if not line.strip():
+                        continue
+                    try:
+                        record = _loads(line)
+                    except ValueError:
+                        # Only the final record can be torn; anything after it
+                        # means the log is corrupt, not interrupted
+                        if mm[mm.tell():].strip():
+                            raise
+                        torn_at = offset
+                        break
+                    records += 1
+                    if record["op"] == "create":
+                        todos.append(record["todo"])
+                    elif record["op"] == "complete":
+                        todos[record["index"]]["completed"] = True
+    except FileNotFoundError:
+        pass
+    
+    if torn_at is not None:
+        logger.warning("Dropping torn last record of %s at byte %d", path, torn_at)
+        os.truncate(path, torn_at)
+    
+    return todos, records
+
+
+def _append_record(record: Dict[str, Any]) -> None:
+    """Append one record to TODOS_LOG (blocking; run it in a worker thread)."""
+    with open(TODOS_LOG, 'ab') as f:
+        f.write(_dumps(record) + b"\n")
+
+
+def _rewrite_log(todos: List[Dict[str, Any]]) -> None:
+    """Replace TODOS_LOG with one create record per todo (blocking)."""
+    tmp_path = TODOS_LOG + ".tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(b"".join(_dumps({"op": "create", "todo": todo}) + b"\n" for todo in todos))
+    os.replace(tmp_path, TODOS_LOG)
+
+
+def _load_todos() -> Tuple[List[Dict[str, Any]], int]:
+    """Replay TODOS_LOG, importing LEGACY_TODOS_FILE into it when the log is empty."""
+    todos, records = _replay(TODOS_LOG)
+    if records:
+        return todos, records
+    
+    try:
+        with open(LEGACY_TODOS_FILE, 'rb') as f:
+            todos = _loads(f.read())
+    except FileNotFoundError:
+        return todos, records
+    
+    _rewrite_log(todos)
+    return todos, len(todos)
+
+
+# In-memory todo list, loaded once at startup; the log is only ever appended to
+_TODOS, _LOG_RECORDS = _load_todos()
+
+# Serializes log writes so records land in the same order as the _TODOS updates
+_TODOS_LOCK = asyncio.Lock()
+
+
 # 1. TOOLS - Functions that can be called by AI clients
 @mcp.tool()
-def get_weather(city: str) -> str:
+async def get_weather(city: str) -> str:
     """Get current weather for a city."""
-    # In a real app, you'd use a weather API
-    return f"The weather in {city} is sunny and 72°F"
+    # wttr.in needs no API key; format=3 returns a one-line "City: condition temperature"
+    try:
+        # Quote the whole name so "/", "?" or "#" can't change the request
+        resp = await _HTTP.get(f"https://wttr.in/{quote(city, safe='')}", params={"format": "3"})
+        resp.raise_for_status()
+    except httpx.HTTPError as e:
+        return f"Could not fetch the weather for {city}: {e}"
+    
+    return resp.text.strip()
 
 @mcp.tool()
-def create_todo(task: str, priority: str = "medium") -> str:
+async def create_todo(task: str, priority: str = "medium") -> str:
     """Create a new todo item."""
+    global _LOG_RECORDS
     todo = {
         "task": task,
         "priority": priority,
@@ -30,70 +160,67 @@ def create_todo(task: str, priority: str = "medium") -> str:
         "completed": False
     }
     
-    # Save to a simple JSON file
-    todos_file = "todos.json"
-    todos = []
-    if os.path.exists(todos_file):
-        with open(todos_file, 'r') as f:
-            todos = json.load(f)
-    
-    todos.append(todo)
-    
-    with open(todos_file, 'w') as f:
-        json.dump(todos, f, indent=2)
+    # Append a single record to the log without blocking the event loop,
+    # and only touch the in-memory list once the record is on disk
+    async with _TODOS_LOCK:
+        await asyncio.to_thread(_append_record, {"op": "create", "todo": todo})
+        _TODOS.append(todo)
+        _LOG_RECORDS += 1
     
     return f"Created todo: '{task}' with priority '{priority}'"
 
 @mcp.tool()
-def list_todos() -> str:
+async def list_todos() -> str:
     """List all current todos."""
-    todos_file = "todos.json"
-    if not os.path.exists(todos_file):
+    if not _TODOS:
         return "No todos found. Create one with create_todo!"
     
-    with open(todos_file, 'r') as f:
-        todos = json.load(f)
-    
-    if not todos:
-        return "No todos found. Create one with create_todo!"
-    
-    result = "Current todos:\n"
-    for i, todo in enumerate(todos, 1):
-        status = "✅" if todo["completed"] else "⏳"
-        result += f"{i}. {status} {todo['task']} (Priority: {todo['priority']})\n"
-    
-    return result
+    lines = (
+        f"{i}. {'✅' if todo['completed'] else '⏳'} {todo['task']} (Priority: {todo['priority']})\n"
+        for i, todo in enumerate(_TODOS, 1)
+    )
+    return "Current todos:\n" + "".join(lines)
 
 @mcp.tool()
-def complete_todo(todo_number: int) -> str:
+async def complete_todo(todo_number: int) -> str:
     """Mark a todo as completed."""
-    todos_file = "todos.json"
-    if not os.path.exists(todos_file):
-        return "No todos found."
-    
-    with open(todos_file, 'r') as f:
-        todos = json.load(f)
+    global _LOG_RECORDS
+    async with _TODOS_LOCK:
+        if not _TODOS:
+            return "No todos found."
+        
+        if todo_number < 1 or todo_number > len(_TODOS):
+            return f"Invalid todo number. Please choose 1-{len(_TODOS)}"
+        
+        todo = _TODOS[todo_number - 1]
+        if todo["completed"]:
+            return f"Todo already completed: '{todo['task']}'"
+        
+        await asyncio.to_thread(_append_record, {"op": "complete", "index": todo_number - 1})
+        todo["completed"] = True
+        _LOG_RECORDS += 1
     
-    if todo_number < 1 or todo_number > len(todos):
-        return f"Invalid todo number. Please choose 1-{len(todos)}"
-    
-    todos[todo_number - 1]["completed"] = True
-    
-    with open(todos_file, 'w') as f:
-        json.dump(todos, f, indent=2)
+    return f"Completed todo: '{todo['task']}'"
+
+@mcp.tool()
+async def compact_todos() -> str:
+    """Rewrite the todo log so it holds one record per todo."""
+    global _LOG_RECORDS
+    async with _TODOS_LOCK:
+        if _LOG_RECORDS <= len(_TODOS):
+            return f"Todo log is already compact ({_LOG_RECORDS} records)."
+        
+        before = _LOG_RECORDS
+        await asyncio.to_thread(_rewrite_log, list(_TODOS))
+        _LOG_RECORDS = len(_TODOS)
     
-    return f"Completed todo: '{todos[todo_number - 1]['task']}'"
+    return f"Compacted todo log from {before} to {_LOG_RECORDS} records."
 
 # 2. RESOURCES - Data that can be accessed
 @mcp.resource("file://todos")
-def get_todos_data() -> str:
+async def get_todos_data() -> str:
     """Get raw todos data as JSON."""
-    todos_file = "todos.json"
-    if not os.path.exists(todos_file):
-        return json.dumps([])
-    
-    with open(todos_file, 'r') as f:
-        return json.dumps(json.load(f), indent=2)
+    return _dumps(_TODOS, indent=True).decode()
 
 @mcp.resource("file://config")
 def get_assistant_config() -> str:
@@ -127,10 +254,16 @@ Use the get_weather tool to get current conditions."""
 
 if __name__ == "__main__":
     print("🚀 Starting Personal Assistant MCP Server...")
-    print("📋 Available tools: get_weather, create_todo, list_todos, complete_todo")
+    print("📋 Available tools: get_weather, create_todo, list_todos, complete_todo, compact_todos")
     print("📁 Available resources: file://todos, file://config")
     print("💬 Available prompts: todo_summary, weather_planning")
     print("\n" + "="*50)
     
-    # Run the server
-    mcp.run()
+    # Run the server on uvloop when it is installed
+    try:
+        import uvloop  # noqa: F401
+    except ImportError:
+        mcp.run()
+    else:
+        import anyio
+        anyio.run(mcp.run_async, backend_options={"use_uvloop": True})
@@ -6,243 +6,257 @@ This script demonstrates the comprehensive GitOps tracking system
 that monitors all operations, deployments, and system health.
 """
 
-import asyncio
 import json
+import sys
 from datetime import datetime, timedelta
 from pathlib import Path
 
-async def demo_gitops_tracking_system():
+# Static demo data, built once at import rather than on every run
+_TRACKING_TABLES = (
+    {
+        "name": "gitops_operations",
+        "description": "Tracks all GitOps operations (migrations, deployments, rollbacks)",
+        "key_fields": ["operation_type", "status", "migration_file", "performed_by"]
+    },
+    {
+        "name": "git_commits", 
+        "description": "Tracks all Git commits with metadata and file changes",
+        "key_fields": ["commit_hash", "commit_message", "files_changed", "lines_added"]
+    },
+    {
+        "name": "deployments",
+        "description": "Tracks deployments across environments (dev, staging, production)",
+        "key_fields": ["deployment_name", "environment", "status", "deployed_by"]
+    },
+    {
+        "name": "system_health_checks",
+        "description": "Tracks system health and performance metrics",
+        "key_fields": ["check_type", "service_name", "status", "response_time_ms"]
+    }
+)
+
+_SAMPLE_OPERATIONS = (
+    {
+        "type": "schema_change",
+        "description": "Create GitOps demo schema with blog system",
+        "file": "002_gitops_demo_schema.sql",
+        "status": "success",
+        "rollback": True
+    },
+    {
+        "type": "schema_change", 
+        "description": "Clean up production data to focus on GitOps",
+        "file": "003_cleanup_production_data.sql",
+        "status": "success",
+        "rollback": False
+    },
+    {
+        "type": "schema_change",
+        "description": "Add view_count column to blog_posts",
+        "file": "004_add_view_count.sql", 
+        "status": "success",
+        "rollback": True
+    }
+)
+
+_SAMPLE_COMMITS = (
+    {
+        "hash": "e58c75f",
+        "message": "Add view_count column to blog_posts",
+        "files": ["migrations/004_add_view_count.sql"],
+        "lines": 20
+    },
+    {
+        "hash": "8c3f1fe", 
+        "message": "Clean up production data to focus on GitOps system",
+        "files": ["migrations/003_cleanup_production_data.sql", "supabase_config.json"],
+        "lines": 44
+    },
+    {
+        "hash": "237397c",
+        "message": "Set up Supabase MCP integration with demo schema", 
+        "files": ["migrations/002_gitops_demo_schema.sql", "supabase_config.json"],
+        "lines": 982
+    }
+)
+
+_SAMPLE_DEPLOYMENTS = (
+    {
+        "name": "GitOps Demo Schema",
+        "environment": "production",
+        "status": "success",
+        "duration": 45,
+        "rollback": True
+    },
+    {
+        "name": "View Count Feature",
+        "environment": "production", 
+        "status": "success",
+        "duration": 23,
+        "rollback": True
+    }
+)
+
+_HEALTH_CHECKS = (
+    {
+        "type": "database_connection",
+        "service": "supabase",
+        "status": "healthy",
+        "response_time": 12
+    },
+    {
+        "type": "migration_system",
+        "service": "gitops",
+        "status": "healthy", 
+        "response_time": 8
+    },
+    {
+        "type": "security_audit",
+        "service": "supabase",
+        "status": "healthy",
+        "response_time": 156
+    }
+)
+
+_TRACKING_QUERIES = (
+    "Show me all successful GitOps operations from the last week",
+    "Find all deployments that failed in the last month",
+    "List all git commits that added more than 100 lines",
+    "Show me the system health status for all services",
+    "Find operations that are available for rollback",
+    "Get a summary of all schema changes made today",
+    "Show me deployment performance metrics",
+    "List all rollbacks performed in the last 30 days"
+)
+
+_BENEFITS = (
+    "📊 Complete audit trail of all system changes",
+    "🔄 Easy rollback identification and execution", 
+    "📈 Performance monitoring and optimization",
+    "🛡️ Security event tracking and compliance",
+    "👥 Team collaboration and accountability",
+    "🚨 Proactive issue detection and alerting",
+    "📚 Automated documentation and reporting",
+    "🔍 Detailed troubleshooting and debugging"
+)
+
+_NEXT_STEPS = (
+    "1. Query recent operations:",
+    "   \"Show me all GitOps operations from today\"",
+    "",
+    "2. Check system health:",
+    "   \"What's the current health status of all services?\"",
+    "",
+    "3. Find rollback candidates:",
+    "   \"Show me all operations available for rollback\"",
+    "",
+    "4. Analyze deployment performance:",
+    "   \"Get deployment statistics for the last week\"",
+    "",
+    "5. Track team activity:",
+    "   \"Show me all commits by Harry Sayers this week\"",
+    "",
+    "6. Monitor system changes:",
+    "   \"List all schema changes made in the last month\""
+)
+
+# Emoji shown for each operation, deployment and health check status
+_STATUS_EMOJI = {
+    "success": "✅",
+    "failed": "❌",
+    "healthy": "✅",
+    "warning": "⚠️",
+    "unhealthy": "❌"
+}
+
+_ROLLBACK_LABEL = {True: "🔄 Available", False: "🚫 Not Available"}
+
+
+def demo_gitops_tracking_system():
     """Demonstrate the GitOps tracking system capabilities."""
     
-    print("🚀 GitOps Operations Tracking System Demo")
-    print("=" * 60)
+    out = []
+    p = out.append
+    
+    p("🚀 GitOps Operations Tracking System Demo")
+    p("=" * 60)
     
     # System overview
-    print(f"📊 System Overview:")
-    print(f"   Project: SSoT1 (zeopoimfsxdidkyiucsr)")
-    print(f"   Tracking Tables: 4 comprehensive tables")
-    print(f"   Demo Time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+    p("📊 System Overview:")
+    p("   Project: SSoT1 (zeopoimfsxdidkyiucsr)")
+    p("   Tracking Tables: 4 comprehensive tables")
+    p(f"   Demo Time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
     
     # 1. Show tracking tables
-    print("\n📋 1. GitOps Tracking Tables:")
-    
-    tracking_tables = [
-        {
-            "name": "gitops_operations",
-            "description": "Tracks all GitOps operations (migrations, deployments, rollbacks)",
-            "key_fields": ["operation_type", "status", "migration_file", "performed_by"]
-        },
-        {
-            "name": "git_commits", 
-            "description": "Tracks all Git commits with metadata and file changes",
-            "key_fields": ["commit_hash", "commit_message", "files_changed", "lines_added"]
-        },
-        {
-            "name": "deployments",
-            "description": "Tracks deployments across environments (dev, staging, production)",
-            "key_fields": ["deployment_name", "environment", "status", "deployed_by"]
-        },
-        {
-            "name": "system_health_checks",
-            "description": "Tracks system health and performance metrics",
-            "key_fields": ["check_type", "service_name", "status", "response_time_ms"]
-        }
-    ]
-    
-    for table in tracking_tables:
-        print(f"  📝 {table['name']}")
-        print(f"     {table['description']}")
-        print(f"     Key fields: {', '.join(table['key_fields'])}")
-        print()
+    p("\n📋 1. GitOps Tracking Tables:")
+    
+    for table in _TRACKING_TABLES:
+        p(f"  📝 {table['name']}")
+        p(f"     {table['description']}")
+        p(f"     Key fields: {', '.join(table['key_fields'])}")
+        p("")
     
     # 2. Show sample operations
-    print("🔄 2. Recent GitOps Operations:")
-    
-    sample_operations = [
-        {
-            "type": "schema_change",
-            "description": "Create GitOps demo schema with blog system",
-            "file": "002_gitops_demo_schema.sql",
-            "status": "success",
-            "rollback": True
-        },
-        {
-            "type": "schema_change", 
-            "description": "Clean up production data to focus on GitOps",
-            "file": "003_cleanup_production_data.sql",
-            "status": "success",
-            "rollback": False
-        },
-        {
-            "type": "schema_change",
-            "description": "Add view_count column to blog_posts",
-            "file": "004_add_view_count.sql", 
-            "status": "success",
-            "rollback": True
-        }
-    ]
-    
-    for i, op in enumerate(sample_operations, 1):
-        status_emoji = "✅" if op["status"] == "success" else "❌"
-        rollback_emoji = "🔄" if op["rollback"] else "🚫"
-        print(f"  {i}. {status_emoji} {op['type']}: {op['description']}")
-        print(f"     File: {op['file']}")
-        print(f"     Rollback: {rollback_emoji} {'Available' if op['rollback'] else 'Not Available'}")
-        print()
+    p("🔄 2. Recent GitOps Operations:")
+    
+    for i, op in enumerate(_SAMPLE_OPERATIONS, 1):
+        status_emoji = _STATUS_EMOJI.get(op["status"], "❌")
+        p(f"  {i}. {status_emoji} {op['type']}: {op['description']}")
+        p(f"     File: {op['file']}")
+        p(f"     Rollback: {_ROLLBACK_LABEL[op['rollback']]}")
+        p("")
     
     # 3. Show git commits tracking
-    print("📝 3. Git Commits Tracking:")
-    
-    sample_commits = [
-        {
-            "hash": "e58c75f",
-            "message": "Add view_count column to blog_posts",
-            "files": ["migrations/004_add_view_count.sql"],
-            "lines": 20
-        },
-        {
-            "hash": "8c3f1fe", 
-            "message": "Clean up production data to focus on GitOps system",
-            "files": ["migrations/003_cleanup_production_data.sql", "supabase_config.json"],
-            "lines": 44
-        },
-        {
-            "hash": "237397c",
-            "message": "Set up Supabase MCP integration with demo schema", 
-            "files": ["migrations/002_gitops_demo_schema.sql", "supabase_config.json"],
-            "lines": 982
-        }
-    ]
-    
-    for commit in sample_commits:
-        print(f"  🔗 {commit['hash'][:8]}... - {commit['message']}")
-        print(f"     Files: {', '.join(commit['files'])}")
-        print(f"     Lines added: {commit['lines']}")
-        print()
+    p("📝 3. Git Commits Tracking:")
+    
+    for commit in _SAMPLE_COMMITS:
+        p(f"  🔗 {commit['hash'][:8]}... - {commit['message']}")
+        p(f"     Files: {', '.join(commit['files'])}")
+        p(f"     Lines added: {commit['lines']}")
+        p("")
     
     # 4. Show deployment tracking
-    print("🚀 4. Deployment Tracking:")
-    
-    sample_deployments = [
-        {
-            "name": "GitOps Demo Schema",
-            "environment": "production",
-            "status": "success",
-            "duration": 45,
-            "rollback": True
-        },
-        {
-            "name": "View Count Feature",
-            "environment": "production", 
-            "status": "success",
-            "duration": 23,
-            "rollback": True
-        }
-    ]
-    
-    for deployment in sample_deployments:
-        status_emoji = "✅" if deployment["status"] == "success" else "❌"
-        rollback_emoji = "🔄" if deployment["rollback"] else "🚫"
-        print(f"  {status_emoji} {deployment['name']} ({deployment['environment']})")
-        print(f"     Duration: {deployment['duration']} seconds")
-        print(f"     Rollback: {rollback_emoji} {'Available' if deployment['rollback'] else 'Not Available'}")
-        print()
+    p("🚀 4. Deployment Tracking:")
+    
+    for deployment in _SAMPLE_DEPLOYMENTS:
+        status_emoji = _STATUS_EMOJI.get(deployment["status"], "❌")
+        p(f"  {status_emoji} {deployment['name']} ({deployment['environment']})")
+        p(f"     Duration: {deployment['duration']} seconds")
+        p(f"     Rollback: {_ROLLBACK_LABEL[deployment['rollback']]}")
+        p("")
     
     # 5. Show system health monitoring
-    print("🏥 5. System Health Monitoring:")
-    
-    health_checks = [
-        {
-            "type": "database_connection",
-            "service": "supabase",
-            "status": "healthy",
-            "response_time": 12
-        },
-        {
-            "type": "migration_system",
-            "service": "gitops",
-            "status": "healthy", 
-            "response_time": 8
-        },
-        {
-            "type": "security_audit",
-            "service": "supabase",
-            "status": "healthy",
-            "response_time": 156
-        }
-    ]
-    
-    for check in health_checks:
-        status_emoji = "✅" if check["status"] == "healthy" else "⚠️" if check["status"] == "warning" else "❌"
-        print(f"  {status_emoji} {check['type']} ({check['service']})")
-        print(f"     Response time: {check['response_time']}ms")
-        print()
+    p("🏥 5. System Health Monitoring:")
+    
+    for check in _HEALTH_CHECKS:
+        status_emoji = _STATUS_EMOJI.get(check["status"], "❌")
+        p(f"  {status_emoji} {check['type']} ({check['service']})")
+        p(f"     Response time: {check['response_time']}ms")
+        p("")
     
     # 6. Show natural language queries you can now use
-    print("🤖 6. Natural Language Queries You Can Now Use:")
-    
-    tracking_queries = [
-        "Show me all successful GitOps operations from the last week",
-        "Find all deployments that failed in the last month",
-        "List all git commits that added more than 100 lines",
-        "Show me the system health status for all services",
-        "Find operations that are available for rollback",
-        "Get a summary of all schema changes made today",
-        "Show me deployment performance metrics",
-        "List all rollbacks performed in the last 30 days"
-    ]
-    
-    for i, query in enumerate(tracking_queries, 1):
-        print(f"  {i}. \"{query}\"")
+    p("🤖 6. Natural Language Queries You Can Now Use:")
+    
+    for i, query in enumerate(_TRACKING_QUERIES, 1):
+        p(f"  {i}. \"{query}\"")
     
     # 7. Show benefits of the tracking system
-    print("\n🎯 7. Benefits of GitOps Tracking:")
-    
-    benefits = [
-        "📊 Complete audit trail of all system changes",
-        "🔄 Easy rollback identification and execution", 
-        "📈 Performance monitoring and optimization",
-        "🛡️ Security event tracking and compliance",
-        "👥 Team collaboration and accountability",
-        "🚨 Proactive issue detection and alerting",
-        "📚 Automated documentation and reporting",
-        "🔍 Detailed troubleshooting and debugging"
-    ]
-    
-    for benefit in benefits:
-        print(f"  {benefit}")
+    p("\n🎯 7. Benefits of GitOps Tracking:")
+    
+    p("  " + "\n  ".join(_BENEFITS))
     
     # 8. Show next steps
-    print("\n🚀 8. Try the Tracking System:")
-    
-    next_steps = [
-        "1. Query recent operations:",
-        "   \"Show me all GitOps operations from today\"",
-        "",
-        "2. Check system health:",
-        "   \"What's the current health status of all services?\"",
-        "",
-        "3. Find rollback candidates:",
-        "   \"Show me all operations available for rollback\"",
-        "",
-        "4. Analyze deployment performance:",
-        "   \"Get deployment statistics for the last week\"",
-        "",
-        "5. Track team activity:",
-        "   \"Show me all commits by Harry Sayers this week\"",
-        "",
-        "6. Monitor system changes:",
-        "   \"List all schema changes made in the last month\""
-    ]
-    
-    for step in next_steps:
-        print(f"  {step}")
-    
-    print("\n🎉 GitOps Tracking System Demo Complete!")
-    print("\n" + "=" * 60)
-    print("You now have comprehensive tracking of all GitOps operations!")
-    print("Every change, deployment, and system event is monitored and recorded.")
-    print("=" * 60)
+    p("\n🚀 8. Try the Tracking System:")
+    
+    p("  " + "\n  ".join(_NEXT_STEPS))
+    
+    p("\n🎉 GitOps Tracking System Demo Complete!")
+    p("\n" + "=" * 60)
+    p("You now have comprehensive tracking of all GitOps operations!")
+    p("Every change, deployment, and system event is monitored and recorded.")
+    p("=" * 60)
+    
+    sys.stdout.write("\n".join(out) + "\n")
 
 if __name__ == "__main__":
-    asyncio.run(demo_gitops_tracking_system())
+    demo_gitops_tracking_system()
@@ -6,165 +6,167 @@ This script demonstrates the complete GitOps + Supabase MCP workflow
 using the new demo schema we created.
 """
 
-import asyncio
 import json
+import sys
 from datetime import datetime
 from pathlib import Path
 
-async def demo_complete_workflow():
+# Static demo data, built once at import rather than on every run
+_PROJECT_ID = "zeopoimfsxdidkyiucsr"
+_PROJECT_NAME = "SSoT1"
+_DEMO_SCHEMA = "gitops_demo"
+
+_DEMO_TABLES = (
+    {"name": "blog_posts", "description": "Blog posts with status and tags"},
+    {"name": "authors", "description": "Author profiles and information"},
+    {"name": "comments", "description": "Comments on blog posts with approval status"}
+)
+
+_EXAMPLE_QUERIES = (
+    "Show me all published blog posts",
+    "List authors who have written posts",
+    "Find comments that need approval",
+    "Get the most recent blog post",
+    "Show posts tagged with 'gitops'"
+)
+
+_MIGRATION_STEPS = (
+    "✅ Schema changes made in Supabase",
+    "✅ Migration file generated from current state",
+    "✅ Migration committed to Git repository",
+    "✅ Pull request created for review",
+    "✅ Automated testing runs in CI/CD",
+    "✅ Security audit validates changes",
+    "✅ Documentation auto-generated",
+    "✅ Changes deployed to staging",
+    "✅ Production deployment after approval"
+)
+
+_SECURITY_FEATURES = (
+    "✅ Row Level Security (RLS) enabled on all tables",
+    "✅ UUID primary keys for security",
+    "✅ Foreign key constraints for data integrity",
+    "✅ Check constraints for data validation",
+    "✅ Automated security audits in CI/CD",
+    "✅ API key management with scoping",
+    "✅ Audit logging for all operations"
+)
+
+_AUTOMATION_FEATURES = (
+    "🔄 Auto-generate TypeScript types from schema",
+    "📚 Auto-generate API documentation",
+    "🧪 Auto-run database tests on schema changes",
+    "🔍 Auto-detect security vulnerabilities",
+    "📊 Auto-generate performance reports",
+    "🔄 Auto-sync schema changes to documentation",
+    "🚨 Auto-alert on critical changes"
+)
+
+_BENEFITS = (
+    "🗣️ Natural language database operations",
+    "📝 Version-controlled schema changes",
+    "🔒 Secure credential management",
+    "📊 Real-time monitoring and alerts",
+    "🤝 Collaborative development workflow",
+    "🚀 Automated deployment pipelines",
+    "📚 Always up-to-date documentation"
+)
+
+_NEXT_STEPS = (
+    "1. Use Supabase MCP to query the demo data:",
+    "   \"Show me all blog posts in the gitops_demo schema\"",
+    "",
+    "2. Make a schema change:",
+    "   \"Add a 'view_count' column to the blog_posts table\"",
+    "",
+    "3. Generate a migration:",
+    "   \"Create a migration file from the current schema\"",
+    "",
+    "4. Commit to Git:",
+    "   \"git add migrations/ && git commit -m 'Add view_count to blog_posts'\"",
+    "",
+    "5. Create a PR:",
+    "   \"Create a pull request for the schema changes\"",
+    "",
+    "6. Watch the automation:",
+    "   \"Monitor the CI/CD pipeline and automated tests\""
+)
+
+_CONFIG = {
+    "project_id": _PROJECT_ID,
+    "demo_schema": _DEMO_SCHEMA,
+    "migration_path": "migrations/",
+    "docs_path": "docs/schema/",
+    "auto_generate_types": True,
+    "auto_generate_docs": True,
+    "security_audit": True,
+    "ci_cd_enabled": True
+}
+
+
+def demo_complete_workflow():
     """Demonstrate the complete GitOps + Supabase MCP workflow."""
     
-    print("🚀 Supabase MCP GitOps Workflow Demo")
-    print("=" * 60)
+    out = []
+    p = out.append
     
-    # Project info
-    project_id = "zeopoimfsxdidkyiucsr"
-    project_name = "SSoT1"
-    demo_schema = "gitops_demo"
+    p("🚀 Supabase MCP GitOps Workflow Demo")
+    p("=" * 60)
     
-    print(f"📊 Project: {project_name} ({project_id})")
-    print(f"🗄️ Demo Schema: {demo_schema}")
-    print(f"⏰ Demo Time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+    # Project info
+    p(f"📊 Project: {_PROJECT_NAME} ({_PROJECT_ID})")
+    p(f"🗄️ Demo Schema: {_DEMO_SCHEMA}")
+    p(f"⏰ Demo Time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
     
     # 1. Show current schema
-    print("\n📋 1. Current Demo Schema:")
-    demo_tables = [
-        {"name": "blog_posts", "description": "Blog posts with status and tags"},
-        {"name": "authors", "description": "Author profiles and information"},
-        {"name": "comments", "description": "Comments on blog posts with approval status"}
-    ]
-    
-    for table in demo_tables:
-        print(f"  📝 {table['name']} - {table['description']}")
+    p("\n📋 1. Current Demo Schema:")
+    for table in _DEMO_TABLES:
+        p(f"  📝 {table['name']} - {table['description']}")
     
     # 2. Demonstrate natural language queries
-    print("\n🤖 2. Natural Language Database Operations:")
-    
-    example_queries = [
-        "Show me all published blog posts",
-        "List authors who have written posts",
-        "Find comments that need approval",
-        "Get the most recent blog post",
-        "Show posts tagged with 'gitops'"
-    ]
+    p("\n🤖 2. Natural Language Database Operations:")
     
-    for i, query in enumerate(example_queries, 1):
-        print(f"  {i}. \"{query}\"")
+    for i, query in enumerate(_EXAMPLE_QUERIES, 1):
+        p(f"  {i}. \"{query}\"")
     
     # 3. Show migration workflow
-    print("\n🔄 3. GitOps Migration Workflow:")
-    
-    migration_steps = [
-        "✅ Schema changes made in Supabase",
-        "✅ Migration file generated from current state",
-        "✅ Migration committed to Git repository",
-        "✅ Pull request created for review",
-        "✅ Automated testing runs in CI/CD",
-        "✅ Security audit validates changes",
-        "✅ Documentation auto-generated",
-        "✅ Changes deployed to staging",
-        "✅ Production deployment after approval"
-    ]
-    
-    for step in migration_steps:
-        print(f"  {step}")
+    p("\n🔄 3. GitOps Migration Workflow:")
     
-    # 4. Show security features
-    print("\n🛡️ 4. Security Features:")
+    p("  " + "\n  ".join(_MIGRATION_STEPS))
     
-    security_features = [
-        "✅ Row Level Security (RLS) enabled on all tables",
-        "✅ UUID primary keys for security",
-        "✅ Foreign key constraints for data integrity",
-        "✅ Check constraints for data validation",
-        "✅ Automated security audits in CI/CD",
-        "✅ API key management with scoping",
-        "✅ Audit logging for all operations"
-    ]
+    # 4. Show security features
+    p("\n🛡️ 4. Security Features:")
     
-    for feature in security_features:
-        print(f"  {feature}")
+    p("  " + "\n  ".join(_SECURITY_FEATURES))
     
     # 5. Show automation capabilities
-    print("\n⚡ 5. Automation Capabilities:")
-    
-    automation_features = [
-        "🔄 Auto-generate TypeScript types from schema",
-        "📚 Auto-generate API documentation",
-        "🧪 Auto-run database tests on schema changes",
-        "🔍 Auto-detect security vulnerabilities",
-        "📊 Auto-generate performance reports",
-        "🔄 Auto-sync schema changes to documentation",
-        "🚨 Auto-alert on critical changes"
-    ]
+    p("\n⚡ 5. Automation Capabilities:")
     
-    for feature in automation_features:
-        print(f"  {feature}")
+    p("  " + "\n  ".join(_AUTOMATION_FEATURES))
     
     # 6. Show integration benefits
-    print("\n🎯 6. Integration Benefits:")
+    p("\n🎯 6. Integration Benefits:")
     
-    benefits = [
-        "🗣️ Natural language database operations",
-        "📝 Version-controlled schema changes",
-        "🔒 Secure credential management",
-        "📊 Real-time monitoring and alerts",
-        "🤝 Collaborative development workflow",
-        "🚀 Automated deployment pipelines",
-        "📚 Always up-to-date documentation"
-    ]
-    
-    for benefit in benefits:
-        print(f"  {benefit}")
+    p("  " + "\n  ".join(_BENEFITS))
     
     # 7. Show next steps
-    print("\n🚀 7. Try It Yourself:")
-    
-    next_steps = [
-        "1. Use Supabase MCP to query the demo data:",
-        "   \"Show me all blog posts in the gitops_demo schema\"",
-        "",
-        "2. Make a schema change:",
-        "   \"Add a 'view_count' column to the blog_posts table\"",
-        "",
-        "3. Generate a migration:",
-        "   \"Create a migration file from the current schema\"",
-        "",
-        "4. Commit to Git:",
-        "   \"git add migrations/ && git commit -m 'Add view_count to blog_posts'\"",
-        "",
-        "5. Create a PR:",
-        "   \"Create a pull request for the schema changes\"",
-        "",
-        "6. Watch the automation:",
-        "   \"Monitor the CI/CD pipeline and automated tests\""
-    ]
-    
-    for step in next_steps:
-        print(f"  {step}")
+    p("\n🚀 7. Try It Yourself:")
+    
+    p("  " + "\n  ".join(_NEXT_STEPS))
     
     # 8. Show configuration
-    print("\n⚙️ 8. Configuration Summary:")
-    
-    config = {
-        "project_id": project_id,
-        "demo_schema": demo_schema,
-        "migration_path": "migrations/",
-        "docs_path": "docs/schema/",
-        "auto_generate_types": True,
-        "auto_generate_docs": True,
-        "security_audit": True,
-        "ci_cd_enabled": True
-    }
-    
-    for key, value in config.items():
-        print(f"  {key}: {value}")
-    
-    print("\n🎉 Demo Complete!")
-    print("\n" + "=" * 60)
-    print("You now have a fully functional GitOps + Supabase MCP integration!")
-    print("The demo schema is ready for experimentation and learning.")
-    print("=" * 60)
+    p("\n⚙️ 8. Configuration Summary:")
+    
+    for key, value in _CONFIG.items():
+        p(f"  {key}: {value}")
+    
+    p("\n🎉 Demo Complete!")
+    p("\n" + "=" * 60)
+    p("You now have a fully functional GitOps + Supabase MCP integration!")
+    p("The demo schema is ready for experimentation and learning.")
+    p("=" * 60)
+    
+    sys.stdout.write("\n".join(out) + "\n")
 
 if __name__ == "__main__":
-    asyncio.run(demo_complete_workflow())
+    demo_complete_workflow()
@@ -6,56 +6,79 @@ This script demonstrates how to use the Supabase MCP tools
 with your existing projects for GitOps workflows.
 """
 
-import asyncio
 import json
 import os
+import sys
 from datetime import datetime
 from pathlib import Path
 
 # This would import the actual Supabase MCP tools
 # For demo purposes, we'll simulate the functionality
 
-async def demo_supabase_mcp_integration():
+# Static demo data, built once at import rather than on every run
+_PROJECTS = (
+    {"id": "zeopoimfsxdidkyiucsr", "name": "SSoT1", "status": "ACTIVE_HEALTHY"},
+    {"id": "hzttajuyxmjteyvyzlxs", "name": "SSoT", "status": "ACTIVE_HEALTHY"},
+    {"id": "rmqsreparqrcfatuaosz", "name": "invoice-dashboard", "status": "INACTIVE"},
+    {"id": "bwvicxsljpqnowzhnrtl", "name": "mokai-client-dashboard", "status": "INACTIVE"}
+)
+
+_TABLES = (
+    {"name": "projects", "rows": 3, "rls": True},
+    {"name": "project_members", "rows": 3, "rls": True},
+    {"name": "environments", "rows": 9, "rls": True},
+    {"name": "items", "rows": 1, "rls": True},
+    {"name": "infra_servers", "rows": 1, "rls": True},
+    {"name": "infra_services", "rows": 1, "rls": True},
+    {"name": "env_vars_map", "rows": 1, "rls": True},
+    {"name": "infra_credentials", "rows": 1, "rls": True},
+    {"name": "inbound_api_keys", "rows": 1, "rls": True}
+)
+
+_GITOPS_STEPS = (
+    "✅ Schema changes tracked in Git",
+    "✅ Migration files versioned",
+    "✅ Automated testing on PR",
+    "✅ Security audit in CI/CD",
+    "✅ Documentation auto-generated",
+    "✅ Rollback procedures defined"
+)
+
+_SECURITY_RECOMMENDATIONS = (
+    "All tables have RLS enabled - excellent security practice",
+    "Consider adding specific RLS policies for each table",
+    "Review API key scopes and expiration dates",
+    "Enable audit logging for sensitive operations"
+)
+
+_PROJECT_STATUS_EMOJI = {"ACTIVE_HEALTHY": "✅"}
+
+
+def demo_supabase_mcp_integration():
     """Demonstrate Supabase MCP integration capabilities."""
     
-    print("🚀 Supabase MCP Integration Demo")
-    print("=" * 50)
+    out = []
+    p = out.append
     
-    # 1. List your projects
-    print("\n📋 1. Your Supabase Projects:")
-    projects = [
-        {"id": "zeopoimfsxdidkyiucsr", "name": "SSoT1", "status": "ACTIVE_HEALTHY"},
-        {"id": "hzttajuyxmjteyvyzlxs", "name": "SSoT", "status": "ACTIVE_HEALTHY"},
-        {"id": "rmqsreparqrcfatuaosz", "name": "invoice-dashboard", "status": "INACTIVE"},
-        {"id": "bwvicxsljpqnowzhnrtl", "name": "mokai-client-dashboard", "status": "INACTIVE"}
-    ]
+    p("🚀 Supabase MCP Integration Demo")
+    p("=" * 50)
     
-    for project in projects:
-        status_emoji = "✅" if project["status"] == "ACTIVE_HEALTHY" else "⏸️"
-        print(f"  {status_emoji} {project['name']} ({project['id'][:8]}...) - {project['status']}")
+    # 1. List your projects
+    p("\n📋 1. Your Supabase Projects:")
+    for project in _PROJECTS:
+        status_emoji = _PROJECT_STATUS_EMOJI.get(project["status"], "⏸️")
+        p(f"  {status_emoji} {project['name']} ({project['id'][:8]}...) - {project['status']}")
     
     # 2. Analyze your active project schema
-    print("\n🗄️ 2. Database Schema Analysis (SSoT1):")
+    p("\n🗄️ 2. Database Schema Analysis (SSoT1):")
     active_project = "zeopoimfsxdidkyiucsr"
     
-    tables = [
-        {"name": "projects", "rows": 3, "rls": True},
-        {"name": "project_members", "rows": 3, "rls": True},
-        {"name": "environments", "rows": 9, "rls": True},
-        {"name": "items", "rows": 1, "rls": True},
-        {"name": "infra_servers", "rows": 1, "rls": True},
-        {"name": "infra_services", "rows": 1, "rls": True},
-        {"name": "env_vars_map", "rows": 1, "rls": True},
-        {"name": "infra_credentials", "rows": 1, "rls": True},
-        {"name": "inbound_api_keys", "rows": 1, "rls": True}
-    ]
-    
-    print(f"  📊 Total Tables: {len(tables)}")
-    print(f"  🔒 RLS Enabled: {sum(1 for t in tables if t['rls'])}/{len(tables)}")
-    print(f"  📈 Total Rows: {sum(t['rows'] for t in tables)}")
+    p(f"  📊 Total Tables: {len(_TABLES)}")
+    p(f"  🔒 RLS Enabled: {sum(1 for t in _TABLES if t['rls'])}/{len(_TABLES)}")
+    p(f"  📈 Total Rows: {sum(t['rows'] for t in _TABLES)}")
     
     # 3. Generate migration from current schema
-    print("\n🔄 3. Generate Migration from Current Schema:")
+    p("\n🔄 3. Generate Migration from Current Schema:")
     migration_name = f"sync_schema_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
     migration_file = f"migrations/{migration_name}.sql"
     
@@ -77,31 +100,26 @@ async def demo_supabase_mcp_integration():
 -- (This would contain the actual RLS policy statements)
 """
     
-    print(f"  📝 Generated: {migration_file}")
-    print(f"  📏 Size: {len(migration_sql)} characters")
+    p(f"  📝 Generated: {migration_file}")
+    p(f"  📏 Size: {len(migration_sql)} characters")
     
     # 4. Security audit
-    print("\n🛡️ 4. Security Audit:")
+    p("\n🛡️ 4. Security Audit:")
     security_results = {
-        "rls_enabled_tables": len([t for t in tables if t['rls']]),
-        "total_tables": len(tables),
+        "rls_enabled_tables": len([t for t in _TABLES if t['rls']]),
+        "total_tables": len(_TABLES),
         "api_keys_count": 1,
-        "recommendations": [
-            "All tables have RLS enabled - excellent security practice",
-            "Consider adding specific RLS policies for each table",
-            "Review API key scopes and expiration dates",
-            "Enable audit logging for sensitive operations"
-        ]
+        "recommendations": _SECURITY_RECOMMENDATIONS
     }
     
-    print(f"  🔒 RLS Coverage: {security_results['rls_enabled_tables']}/{security_results['total_tables']} tables")
-    print(f"  🔑 API Keys: {security_results['api_keys_count']} configured")
-    print("  💡 Recommendations:")
+    p(f"  🔒 RLS Coverage: {security_results['rls_enabled_tables']}/{security_results['total_tables']} tables")
+    p(f"  🔑 API Keys: {security_results['api_keys_count']} configured")
+    p("  💡 Recommendations:")
     for rec in security_results['recommendations']:
-        print(f"    • {rec}")
+        p(f"    • {rec}")
     
     # 5. Generate documentation
-    print("\n📚 5. Generate Documentation:")
+    p("\n📚 5. Generate Documentation:")
     doc_file = f"docs/schema/schema_{active_project}.md"
     doc_content = f"""# Database Schema Documentation
 
@@ -142,30 +160,22 @@ This project contains a comprehensive project management system with:
 ⚠️ **Review RLS policies** for specific access patterns
 """
     
-    print(f"  📄 Generated: {doc_file}")
-    print(f"  📏 Size: {len(doc_content)} characters")
+    p(f"  📄 Generated: {doc_file}")
+    p(f"  📏 Size: {len(doc_content)} characters")
     
     # 6. GitOps workflow integration
-    print("\n🔄 6. GitOps Workflow Integration:")
-    gitops_steps = [
-        "✅ Schema changes tracked in Git",
-        "✅ Migration files versioned",
-        "✅ Automated testing on PR",
-        "✅ Security audit in CI/CD",
-        "✅ Documentation auto-generated",
-        "✅ Rollback procedures defined"
-    ]
+    p("\n🔄 6. GitOps Workflow Integration:")
+    p("  " + "\n  ".join(_GITOPS_STEPS))
     
-    for step in gitops_steps:
-        print(f"  {step}")
+    p("\n🎉 Demo Complete!")
+    p("\nNext Steps:")
+    p("1. Run: python scripts/supabase_mcp_demo.py")
+    p("2. Review generated migration files")
+    p("3. Commit changes to Git")
+    p("4. Create PR for review")
+    p("5. Deploy to staging for testing")
     
-    print("\n🎉 Demo Complete!")
-    print("\nNext Steps:")
-    print("1. Run: python scripts/supabase_mcp_demo.py")
-    print("2. Review generated migration files")
-    print("3. Commit changes to Git")
-    print("4. Create PR for review")
-    print("5. Deploy to staging for testing")
+    sys.stdout.write("\n".join(out) + "\n")
 
 if __name__ == "__main__":
-    asyncio.run(demo_supabase_mcp_integration())
+    demo_supabase_mcp_integration()
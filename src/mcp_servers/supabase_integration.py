@@ -9,20 +9,145 @@ integrating with the GitOps workflow for database management.
 import asyncio
 import json
 import os
-from typing import Any, Dict, List, Optional
+import re
+import time
+from typing import Any, Dict, List, Optional, Tuple
 from datetime import datetime
 
 from fastmcp import FastMCP
-from fastmcp.server import Tool
+
+# Serialize tool results with orjson when it is installed; otherwise FastMCP's
+# default pydantic_core encoder is used
+try:
+    import orjson
+
+    def _serialize(data: Any) -> str:
+        return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS).decode()
+except ImportError:
+    _serialize = None
 
 # Initialize FastMCP server
-mcp = FastMCP("Supabase Integration Server")
+mcp = FastMCP("Supabase Integration Server", tool_serializer=_serialize)
 
 # Configuration
 SUPABASE_PROJECT_ID = os.getenv("SUPABASE_PROJECT_ID", "zeopoimfsxdidkyiucsr")
 SUPABASE_URL = os.getenv("SUPABASE_URL")
 SUPABASE_ANON_KEY = os.getenv("SUPABASE_ANON_KEY")
 
+# The read-only tools below return mostly fixed data; build it once at import
+# and only fill in the per-call fields
+_DATABASE_VERSION = "17.4.1.075"
+
+_PROJECT_TABLES = [
+    {
+        "name": "projects",
+        "schema": "public",
+        "rls_enabled": True,
+        "rows": 3,
+        "columns": [
+            {"name": "id", "type": "uuid", "primary_key": True},
+            {"name": "name", "type": "text"},
+            {"name": "slug", "type": "text", "unique": True},
+            {"name": "created_by", "type": "uuid"},
+            {"name": "created_at", "type": "timestamptz"}
+        ]
+    },
+    {
+        "name": "project_members",
+        "schema": "public", 
+        "rls_enabled": True,
+        "rows": 3,
+        "columns": [
+            {"name": "project_id", "type": "uuid", "primary_key": True},
+            {"name": "user_id", "type": "uuid", "primary_key": True},
+            {"name": "role", "type": "text"},
+            {"name": "added_at", "type": "timestamptz"}
+        ]
+    }
+]
+
+_TABLES_WITH_RLS = [
+    "projects", "project_members", "environments", 
+    "items", "infra_servers", "infra_services",
+    "env_vars_map", "infra_credentials", "inbound_api_keys"
+]
+
+# Last ISO timestamp handed out by _now_iso, as (monotonic time, ISO string)
+_cached_ts: Tuple[float, str] = (0.0, "")
+
+
+def _now_iso() -> str:
+    """Current time as an ISO string, reused for up to 100 ms between calls."""
+    global _cached_ts
+    now = time.monotonic()
+    if now - _cached_ts[0] > 0.1:
+        _cached_ts = (now, datetime.now().isoformat())
+    return _cached_ts[1]
+
+# Generated file templates; only the name, timestamp and project slots vary per call
+_MIGRATION_TPL = """-- Migration: {name}
+-- Generated: {ts}
+-- Project: {pid}
+
+-- This migration was auto-generated from the current schema
+-- Review and modify as needed before applying
+
+-- Example: Add new column to projects table
+-- ALTER TABLE projects ADD COLUMN description TEXT;
+
+-- Example: Create new index
+-- CREATE INDEX IF NOT EXISTS idx_projects_created_at ON projects(created_at);
+""".format
+
+_DOC_TPL = """# Database Schema Documentation
+
+Generated: {ts}
+Project: {pid}
+
+## Tables
+
+### projects
+- **Purpose**: Core project information
+- **RLS**: Enabled
+- **Columns**:
+  - `id` (uuid, primary key)
+  - `name` (text)
+  - `slug` (text, unique)
+  - `created_by` (uuid, foreign key to auth.users)
+  - `created_at` (timestamptz)
+
+### project_members
+- **Purpose**: Project membership and roles
+- **RLS**: Enabled
+- **Columns**:
+  - `project_id` (uuid, primary key, foreign key to projects)
+  - `user_id` (uuid, primary key, foreign key to auth.users)
+  - `role` (text: owner|admin|member|viewer)
+  - `added_at` (timestamptz)
+""".format
+
+# Every statement validate_migration_safety flags, matched in one pass over the SQL
+_DANGER_RE = re.compile(rb"\b(DROP\s+TABLE|TRUNCATE|DELETE\s+FROM|ALTER\s+TABLE)\b", re.IGNORECASE)
+
+# Comments and string literals, blanked out before scanning so that commented-out
+# examples and quoted text aren't reported as statements
+_SQL_NOISE_RE = re.compile(rb"'(?:[^']|'')*'|--[^\n]*|/\*.*?\*/", re.DOTALL)
+
+# Finding for each destructive statement: DROP TABLE, TRUNCATE and DELETE FROM
+# lose data, ALTER TABLE only earns a rollback recommendation
+_DANGER_FINDINGS = {
+    "DROP TABLE": ("warnings", "Migration contains DROP TABLE - ensure this is intentional"),
+    "TRUNCATE": ("warnings", "Migration contains TRUNCATE - all rows in the table will be removed"),
+    "DELETE FROM": ("warnings", "Migration contains DELETE FROM - check the WHERE clause before applying"),
+    "ALTER TABLE": ("recommendations", "Consider adding rollback SQL for ALTER TABLE operations"),
+}
+
+_SECURITY_RECOMMENDATIONS = [
+    "All tables have RLS enabled - good security practice",
+    "Consider adding specific policies for each table",
+    "Review API key scopes and expiration dates"
+]
+
 @mcp.tool()
 async def get_project_status(project_id: str = SUPABASE_PROJECT_ID) -> Dict[str, Any]:
     """
@@ -40,9 +165,9 @@ async def get_project_status(project_id: str = SUPABASE_PROJECT_ID) -> Dict[str,
         return {
             "project_id": project_id,
             "status": "ACTIVE_HEALTHY",
-            "last_checked": datetime.now().isoformat(),
+            "last_checked": _now_iso(),
             "database": {
-                "version": "17.4.1.075",
+                "version": _DATABASE_VERSION,
                 "host": f"db.{project_id}.supabase.co"
             },
             "tables_count": 8,
@@ -65,33 +190,7 @@ async def list_project_tables(project_id: str = SUPABASE_PROJECT_ID) -> List[Dic
     try:
         # This would use the Supabase MCP list_tables tool
         # For now, return the structure we know exists
-        return [
-            {
-                "name": "projects",
-                "schema": "public",
-                "rls_enabled": True,
-                "rows": 3,
-                "columns": [
-                    {"name": "id", "type": "uuid", "primary_key": True},
-                    {"name": "name", "type": "text"},
-                    {"name": "slug", "type": "text", "unique": True},
-                    {"name": "created_by", "type": "uuid"},
-                    {"name": "created_at", "type": "timestamptz"}
-                ]
-            },
-            {
-                "name": "project_members",
-                "schema": "public", 
-                "rls_enabled": True,
-                "rows": 3,
-                "columns": [
-                    {"name": "project_id", "type": "uuid", "primary_key": True},
-                    {"name": "user_id", "type": "uuid", "primary_key": True},
-                    {"name": "role", "type": "text"},
-                    {"name": "added_at", "type": "timestamptz"}
-                ]
-            }
-        ]
+        return _PROJECT_TABLES
     except Exception as e:
         return [{"error": str(e), "project_id": project_id}]
 
@@ -112,27 +211,18 @@ async def generate_migration_from_schema(
     """
     try:
         # This would analyze the current schema and generate migration
-        migration_sql = f"""-- Migration: {migration_name}
--- Generated: {datetime.now().isoformat()}
--- Project: {project_id}
-
--- This migration was auto-generated from the current schema
--- Review and modify as needed before applying
-
--- Example: Add new column to projects table
--- ALTER TABLE projects ADD COLUMN description TEXT;
-
--- Example: Create new index
--- CREATE INDEX IF NOT EXISTS idx_projects_created_at ON projects(created_at);
-"""
+        # One clock read for the header, the file name and generated_at
+        now = datetime.now()
+        now_iso = now.isoformat()
+        migration_sql = _MIGRATION_TPL(name=migration_name, ts=now_iso, pid=project_id)
         
-        migration_file = f"migrations/{datetime.now().strftime('%Y%m%d_%H%M%S')}_{migration_name}.sql"
+        migration_file = f"migrations/{now.strftime('%Y%m%d_%H%M%S')}_{migration_name}.sql"
         
         return {
             "migration_file": migration_file,
             "sql_content": migration_sql,
             "project_id": project_id,
-            "generated_at": datetime.now().isoformat()
+            "generated_at": now_iso
         }
     except Exception as e:
         return {"error": str(e), "project_id": project_id}
@@ -157,19 +247,28 @@ async def validate_migration_safety(
         validation_results = {
             "migration_file": migration_file,
             "project_id": project_id,
-            "validated_at": datetime.now().isoformat(),
+            "validated_at": _now_iso(),
             "status": "SAFE",
             "warnings": [],
             "recommendations": []
         }
         
-        # Example validation logic
-        if "DROP TABLE" in migration_file.upper():
-            validation_results["warnings"].append("Migration contains DROP TABLE - ensure this is intentional")
-            validation_results["status"] = "WARNING"
+        try:
+            with open(migration_file, "rb") as f:
+                sql = f.read()
+        except FileNotFoundError:
+            return {"error": f"Migration file not found: {migration_file}", "migration_file": migration_file}
         
-        if "ALTER TABLE" in migration_file.upper():
-            validation_results["recommendations"].append("Consider adding rollback SQL for ALTER TABLE operations")
+        seen = set()
+        for match in _DANGER_RE.finditer(_SQL_NOISE_RE.sub(b" ", sql)):
+            statement = b" ".join(match.group(1).upper().split()).decode()
+            if statement in seen:
+                continue
+            seen.add(statement)
+            bucket, message = _DANGER_FINDINGS[statement]
+            validation_results[bucket].append(message)
+            if bucket == "warnings":
+                validation_results["status"] = "WARNING"
         
         return validation_results
     except Exception as e:
@@ -192,32 +291,8 @@ async def sync_schema_to_docs(
     """
     try:
         # This would generate markdown documentation from schema
-        doc_content = f"""# Database Schema Documentation
-
-Generated: {datetime.now().isoformat()}
-Project: {project_id}
-
-## Tables
-
-### projects
-- **Purpose**: Core project information
-- **RLS**: Enabled
-- **Columns**:
-  - `id` (uuid, primary key)
-  - `name` (text)
-  - `slug` (text, unique)
-  - `created_by` (uuid, foreign key to auth.users)
-  - `created_at` (timestamptz)
-
-### project_members
-- **Purpose**: Project membership and roles
-- **RLS**: Enabled
-- **Columns**:
-  - `project_id` (uuid, primary key, foreign key to projects)
-  - `user_id` (uuid, primary key, foreign key to auth.users)
-  - `role` (text: owner|admin|member|viewer)
-  - `added_at` (timestamptz)
-"""
+        now_iso = _now_iso()
+        doc_content = _DOC_TPL(ts=now_iso, pid=project_id)
         
         doc_file = f"{output_dir}/schema_{project_id}.md"
         
@@ -225,7 +300,7 @@ Project: {project_id}
             "doc_file": doc_file,
             "content": doc_content,
             "project_id": project_id,
-            "generated_at": datetime.now().isoformat()
+            "generated_at": now_iso
         }
     except Exception as e:
         return {"error": str(e), "project_id": project_id}
@@ -247,18 +322,10 @@ async def check_security_policies(
         # This would check RLS policies and security settings
         security_audit = {
             "project_id": project_id,
-            "audited_at": datetime.now().isoformat(),
+            "audited_at": _now_iso(),
             "rls_status": "ENABLED",
-            "tables_with_rls": [
-                "projects", "project_members", "environments", 
-                "items", "infra_servers", "infra_services",
-                "env_vars_map", "infra_credentials", "inbound_api_keys"
-            ],
-            "recommendations": [
-                "All tables have RLS enabled - good security practice",
-                "Consider adding specific policies for each table",
-                "Review API key scopes and expiration dates"
-            ],
+            "tables_with_rls": _TABLES_WITH_RLS,
+            "recommendations": _SECURITY_RECOMMENDATIONS,
             "warnings": []
         }
         
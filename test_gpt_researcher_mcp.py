@@ -2,165 +2,375 @@
 Test script for GPT Researcher MCP Server
 
 This script tests the basic functionality of the MCP server tools.
+
+The tests are independent, so they can be spread over pytest-xdist workers:
+
+    pytest -n auto --dist loadgroup test_gpt_researcher_mcp.py
+
+Each worker is its own process with its own research cache. Live tests share
+the "network" group so a single worker sends them to the upstream API. With
+pytest-recording installed, their HTTP traffic is recorded to
+cassettes/test_gpt_researcher_mcp/ on the first run and replayed afterwards.
+
+PYTEST_DONT_REWRITE: the checks here are plain key and value assertions, so
+pytest skips rewriting this module's asserts at collection.
+
+CI also runs this module under python -O, which strips every assert. Keep
+asserts free of side effects: call the tool first, then assert on the result.
 """
 
-# Import the MCP server to access the tools
-import gpt_researcher_mcp
+import asyncio
+import sys
+from types import MappingProxyType
+
+import pytest
+from jsonschema import Draft202012Validator
+
+# Tests reach the MCP server through the session-scoped research_server
+# fixture from conftest.py, so the module is imported once, on first use.
+# Research calls go to the canned FakeGPTResearcher from conftest.py unless a
+# test is marked live (run those with --run-live)
+pytestmark = pytest.mark.usefixtures("fake_researcher")
+
+
+# Keys checked together with one subset (or intersection) test
+_FULL_RESULT_KEYS = frozenset({"success", "query", "report", "citations", "metadata", "error"})
+_REPORT_KEYS = frozenset({"report", "citations"})
+_SUMMARY_KEYS = frozenset({"report_length", "citation_count", "report_preview", "report_id"})
+_CAPABILITY_KEYS = frozenset({"supported_report_types", "supported_sources", "supported_document_formats"})
+_VALIDATION_KEYS = frozenset({"gpt_researcher_installed", "api_keys_configured", "setup_instructions"})
+
+
+# Read-only MCP server configuration for the hybrid research case. env stays a
+# plain dict: values nested under Dict[str, Any] reach the research cache key
+# unconverted, and that key is built with json.dumps
+_MCP_CONFIGS = (
+    MappingProxyType({
+        "name": "test",
+        "command": "echo",
+        "args": ("test",),
+        "env": {}
+    }),
+)
+
+
+# (tool name, keyword arguments, keys the result must contain) for the tools
+# whose tests share the call-and-check-keys scaffold
+CASES = [
+    (
+        "get_research_capabilities",
+        {},
+        frozenset({"success", "capabilities"})
+    ),
+    (
+        "validate_research_setup",
+        {},
+        frozenset({"success", "validation_results"})
+    ),
+    (
+        "conduct_research",
+        {
+            "query": "What is artificial intelligence?",
+            "report_type": "research_report",
+            "report_source": "web",
+            "max_iterations": 1
+        },
+        _FULL_RESULT_KEYS
+    ),
+    (
+        "research_local_documents",
+        {
+            "query": "Test query",
+            "doc_path": "/nonexistent/path",
+            "report_type": "research_report"
+        },
+        frozenset({"success", "query"})
+    ),
+    (
+        "deep_research",
+        {
+            "query": "Test deep research query",
+            "depth": 2,
+            "breadth": 3,
+            "max_iterations": 2
+        },
+        frozenset({"success", "query", "metadata"})
+    ),
+    (
+        "hybrid_research_with_mcp",
+        {
+            "query": "Test hybrid research",
+            "mcp_configs": _MCP_CONFIGS,
+            "report_type": "research_report"
+        },
+        frozenset({"success", "query"})
+    ),
+]
+
+
+async def call_tool_async(server, tool, kwargs):
+    """Call one of server's tool functions, awaiting it if it is a coroutine"""
+    result = getattr(server, tool).fn(**kwargs)
+    if asyncio.iscoroutine(result):
+        result = await result
+    return result
 
 
-def test_get_research_capabilities():
-    """Test getting research capabilities"""
-    result = gpt_researcher_mcp.get_research_capabilities.fn()
+def _case_validator(kwargs, expected):
+    """Validator requiring the expected keys and, for research tools, the echoed query"""
+    schema = {"type": "object", "required": sorted(expected)}
+    if "query" in kwargs:
+        schema["properties"] = {"query": {"const": kwargs["query"]}}
+    return Draft202012Validator(schema)
+
+
+# One validator per case, built once at import
+VALIDATORS = {tool: _case_validator(kwargs, expected) for tool, kwargs, expected in CASES}
+
+
+def check_result(tool, result):
+    """Validate a tool result against its case's schema"""
+    VALIDATORS[tool].validate(result)
+
+
+@pytest.mark.parametrize("tool,kwargs,expected", CASES, ids=[case[0] for case in CASES])
+async def test_tool(research_server, tool, kwargs, expected):
+    """Test that each tool returns a dict with its expected keys"""
+    result = await call_tool_async(research_server, tool, kwargs)
     
-    assert isinstance(result, dict)
-    assert "success" in result
-    assert "capabilities" in result
+    check_result(tool, result)
+
+
+def test_get_research_capabilities(research_server):
+    """Test the capability lists reported by get_research_capabilities"""
+    result = research_server.get_research_capabilities.fn()
     
     if result["success"]:
         capabilities = result["capabilities"]
-        assert "supported_report_types" in capabilities
-        assert "supported_sources" in capabilities
-        assert "supported_document_formats" in capabilities
+        assert _CAPABILITY_KEYS <= capabilities.keys()
 
 
-def test_validate_research_setup():
-    """Test research setup validation"""
-    result = gpt_researcher_mcp.validate_research_setup.fn()
+def test_validate_research_setup(research_server):
+    """Test the checks reported by validate_research_setup"""
+    validation = research_server.validate_research_setup.fn()["validation_results"]
     
-    assert isinstance(result, dict)
-    assert "success" in result
-    assert "validation_results" in result
-    
-    validation = result["validation_results"]
-    assert "gpt_researcher_installed" in validation
-    assert "api_keys_configured" in validation
-    assert "setup_instructions" in validation
+    assert _VALIDATION_KEYS <= validation.keys()
 
 
-def test_conduct_research_basic():
-    """Test basic research functionality"""
-    result = gpt_researcher_mcp.conduct_research.fn(
+@pytest.mark.live
+@pytest.mark.vcr
+@pytest.mark.xdist_group("network")
+@pytest.mark.timeout(360)
+async def test_conduct_research_live(research_server):
+    """Test basic research against the real GPT Researcher backend"""
+    pytest.importorskip("gpt_researcher")
+    result = await research_server.conduct_research.fn(
         query="What is artificial intelligence?",
-        report_type="research_report",
-        report_source="web",
         max_iterations=1
     )
     
-    assert isinstance(result, dict)
-    assert "success" in result
-    assert "query" in result
-    assert "report" in result
-    assert "citations" in result
-    assert "metadata" in result
-    assert "error" in result
-    
-    # Check that the query is preserved
-    assert result["query"] == "What is artificial intelligence?"
+    assert result["success"] is True, result["error"]
+    assert result["report"]
 
 
-def test_research_local_documents():
-    """Test local document research"""
-    result = gpt_researcher_mcp.research_local_documents.fn(
-        query="Test query",
-        doc_path="/nonexistent/path",
-        report_type="research_report"
+async def test_conduct_research_summary_only(research_server):
+    """Test that summary_only replaces the report with a compact envelope"""
+    result = await research_server.conduct_research.fn(
+        query="What is artificial intelligence?",
+        max_iterations=1,
+        summary_only=True
     )
     
     assert isinstance(result, dict)
-    assert "success" in result
-    assert "query" in result
-    assert result["query"] == "Test query"
+    assert not _REPORT_KEYS & result.keys()
+    assert _SUMMARY_KEYS <= result.keys()
+    assert result["query"] == "What is artificial intelligence?"
 
 
-def test_deep_research():
-    """Test deep research functionality"""
-    result = gpt_researcher_mcp.deep_research.fn(
+async def test_conduct_research_timeout(research_server, monkeypatch):
+    """Test that a research run past RESEARCH_TIMEOUT fails instead of hanging"""
+    researcher_cls = research_server._GPTResearcher
+    
+    class StalledResearcher(researcher_cls):
+        async def conduct_research(self):
+            await asyncio.sleep(10)
+    
+    monkeypatch.setattr(research_server, "_GPTResearcher", StalledResearcher)
+    monkeypatch.setattr(research_server, "RESEARCH_TIMEOUT", 0.05)
+    
+    result = await research_server.conduct_research.fn(query="Stalled query")
+    
+    assert result["success"] is False
+    assert "timed out" in result["error"]
+
+
+async def test_identical_calls_share_one_run(research_server, monkeypatch):
+    """Test that identical concurrent calls share a run, and cancelling one caller spares the others"""
+    created = []
+    
+    class SlowResearcher(research_server._GPTResearcher):
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            created.append(self)
+        
+        async def conduct_research(self):
+            await asyncio.sleep(0.05)
+            return await super().conduct_research()
+    
+    monkeypatch.setattr(research_server, "_GPTResearcher", SlowResearcher)
+    
+    first = asyncio.create_task(research_server.conduct_research.fn(query="Shared query"))
+    second = asyncio.create_task(research_server.conduct_research.fn(query="Shared query"))
+    await asyncio.sleep(0.01)
+    first.cancel()
+    result = await second
+    
+    assert first.cancelled()
+    assert result["success"] is True
+    assert len(created) == 1
+    assert not research_server._INFLIGHT
+
+
+async def test_retry_after_cancel_starts_fresh_run(research_server, monkeypatch):
+    """Test that a call made while a cancelled run winds down doesn't join it"""
+    created = []
+    
+    class SlowCleanupResearcher(research_server._GPTResearcher):
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            created.append(self)
+        
+        async def conduct_research(self):
+            try:
+                await asyncio.sleep(0.05)
+            finally:
+                # Like an HTTP client closing its connections
+                await asyncio.sleep(0.02)
+            return await super().conduct_research()
+    
+    monkeypatch.setattr(research_server, "_GPTResearcher", SlowCleanupResearcher)
+    
+    first = asyncio.create_task(research_server.conduct_research.fn(query="Retried query"))
+    await asyncio.sleep(0.01)
+    first.cancel()
+    await asyncio.sleep(0)
+    result = await research_server.conduct_research.fn(query="Retried query")
+    
+    assert first.cancelled()
+    assert result["success"] is True
+    assert len(created) == 2
+
+
+async def test_cache_hit_returns_callers_own_copy(research_server):
+    """Test that a cached result is copied and echoes the caller's query"""
+    first = await research_server.conduct_research.fn(query="Hello World")
+    second = await research_server.conduct_research.fn(query="hello world")
+    
+    assert second is not first
+    assert second["query"] == "hello world"
+    assert second["metadata"]["query"] == "hello world"
+    assert first["query"] == "Hello World"
+
+
+async def test_local_document_research_is_not_cached(research_server, tmp_path):
+    """Test that research over local documents reruns instead of hitting the cache"""
+    for _ in range(2):
+        result = await research_server.research_local_documents.fn(
+            query="Local query",
+            doc_path=str(tmp_path)
+        )
+        assert result["success"] is True
+    
+    assert research_server.get_cache_stats.fn()["size"] == 0
+
+
+@pytest.mark.parametrize("depth,breadth", [(2, 0), (2, -1), (0, 3), (6, 3), (2, 11)])
+async def test_deep_research_rejects_out_of_range_shape(research_server, depth, breadth):
+    """Test that deep_research validates depth and breadth before running"""
+    result = await research_server.deep_research.fn(
         query="Test deep research query",
-        depth=2,
-        breadth=3,
-        max_iterations=2
+        depth=depth,
+        breadth=breadth
     )
     
-    assert isinstance(result, dict)
-    assert "success" in result
-    assert "query" in result
-    assert "metadata" in result
-    assert result["query"] == "Test deep research query"
+    assert result["success"] is False
+    assert "Invalid research configuration" in result["error"]
 
 
-def test_hybrid_research_with_mcp():
-    """Test hybrid research with MCP"""
-    mcp_configs = [
-        {
-            "name": "test",
-            "command": "echo",
-            "args": ["test"],
-            "env": {}
-        }
-    ]
-    
-    result = gpt_researcher_mcp.hybrid_research_with_mcp.fn(
-        query="Test hybrid research",
-        mcp_configs=mcp_configs,
-        report_type="research_report"
+async def test_research_local_documents_missing_path(research_server):
+    """Test that a missing document directory fails before any research runs"""
+    result = await research_server.research_local_documents.fn(
+        query="Test query",
+        doc_path="/nonexistent/path"
+    )
+    
+    assert result["success"] is False
+    assert "/nonexistent/path" in result["error"]
+
+
+async def test_clear_research_cache(research_server):
+    """Test that clearing the research cache makes the next call run fresh research"""
+    await research_server.conduct_research.fn(query="Cached query")
+    
+    result = research_server.clear_research_cache.fn()
+    
+    assert result["success"] is True
+    assert result["cleared"] == 1
+    await research_server.conduct_research.fn(query="Cached query")
+    assert research_server.get_cache_stats.fn()["hits"] == 0
+
+
+async def test_get_cache_stats(research_server):
+    """Test that a repeated research call is counted as a cache hit"""
+    await research_server.conduct_research.fn(query="Stats query")
+    await research_server.conduct_research.fn(query="Stats query")
+    
+    result = research_server.get_cache_stats.fn()
+    
+    assert result["success"] is True
+    assert result["hits"] == 1
+    assert result["misses"] == 1
+    assert result["hit_rate"] > 0
+    assert result["size"] == 1
+
+
+async def test_batch_execute(research_server):
+    """Test running several tool calls in one batch"""
+    result = await research_server.batch_execute.fn(
+        operations=[
+            {"tool": "validate_research_setup", "arguments": {}},
+            {"tool": "no_such_tool", "arguments": {}}
+        ]
     )
     
     assert isinstance(result, dict)
-    assert "success" in result
-    assert "query" in result
-    assert result["query"] == "Test hybrid research"
+    assert result["success"] is True
+    assert len(result["results"]) == 2
+    
+    validation, missing = result["results"]
+    assert validation["tool"] == "validate_research_setup"
+    assert validation["success"] is True
+    assert "validation_results" in validation["result"]
+    assert missing["success"] is False
+    assert missing["error"]
 
 
-def test_research_config_validation():
+async def test_research_config_validation(research_server):
     """Test that research configurations are properly validated"""
     # Test with invalid max_iterations
-    result = gpt_researcher_mcp.conduct_research.fn(
+    result = await research_server.conduct_research.fn(
         query="Test query",
-        max_iterations=15  # Should be capped at 10
+        max_iterations=15  # Outside the allowed 1-10 range
     )
     
     assert isinstance(result, dict)
-    assert "success" in result
+    assert result["success"] is False
+    assert "max_iterations" in result["error"]
 
 
 if __name__ == "__main__":
-    # Run basic tests
-    print("Testing GPT Researcher MCP Server...")
-    
-    try:
-        test_get_research_capabilities()
-        print("✓ get_research_capabilities test passed")
-    except Exception as e:
-        print(f"✗ get_research_capabilities test failed: {e}")
-    
-    try:
-        test_validate_research_setup()
-        print("✓ validate_research_setup test passed")
-    except Exception as e:
-        print(f"✗ validate_research_setup test failed: {e}")
-    
-    try:
-        test_conduct_research_basic()
-        print("✓ conduct_research_basic test passed")
-    except Exception as e:
-        print(f"✗ conduct_research_basic test failed: {e}")
-    
-    try:
-        test_research_local_documents()
-        print("✓ research_local_documents test passed")
-    except Exception as e:
-        print(f"✗ research_local_documents test failed: {e}")
-    
-    try:
-        test_deep_research()
-        print("✓ deep_research test passed")
-    except Exception as e:
-        print(f"✗ deep_research test failed: {e}")
-    
-    try:
-        test_hybrid_research_with_mcp()
-        print("✓ hybrid_research_with_mcp test passed")
-    except Exception as e:
-        print(f"✗ hybrid_research_with_mcp test failed: {e}")
-    
-    print("\nBasic tests completed!")
+    # No header and no .pytest_cache writes for these quick runs
+    sys.exit(pytest.main([
+        __file__, "-x", "-q", "--no-header", "-p", "no:cacheprovider",
+        "-n", "auto", "--dist", "loadgroup"
+    ]))
@@ -0,0 +1,162 @@
+"""
+Tests for the todo log behind the Personal Assistant example server.
+
+Each test runs in its own temporary directory, so the log files it creates
+never touch the working tree.
+"""
+
+import json
+
+import httpx
+import pytest
+
+import practical_example
+
+
+@pytest.fixture
+def todo_dir(tmp_path, monkeypatch):
+    """Run the test from an empty directory"""
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
+
+
+def test_load_todos_imports_legacy_file(todo_dir):
+    """Test that an existing todos.json is imported into the log once"""
+    legacy = [{"task": "Old task", "priority": "high", "created": "2024-01-01", "completed": True}]
+    (todo_dir / "todos.json").write_text(json.dumps(legacy))
+    
+    todos, records = practical_example._load_todos()
+    
+    assert todos == legacy
+    assert records == 1
+    assert practical_example._replay("todos.jsonl") == (legacy, 1)
+
+
+def test_load_todos_prefers_existing_log(todo_dir):
+    """Test that the legacy file is ignored once the log has records"""
+    (todo_dir / "todos.json").write_text(json.dumps([{"task": "Old task"}]))
+    (todo_dir / "todos.jsonl").write_text(
+        json.dumps({"op": "create", "todo": {"task": "New task", "completed": False}}) + "\n"
+    )
+    
+    todos, records = practical_example._load_todos()
+    
+    assert [todo["task"] for todo in todos] == ["New task"]
+    assert records == 1
+
+
+def _write_log(path, *records, tail=b""):
+    path.write_bytes(b"".join(json.dumps(r).encode() + b"\n" for r in records) + tail)
+
+
+def test_replay(todo_dir):
+    """Test that create and complete records rebuild the todo list"""
+    _write_log(
+        todo_dir / "todos.jsonl",
+        {"op": "create", "todo": {"task": "First", "completed": False}},
+        {"op": "create", "todo": {"task": "Second", "completed": False}},
+        {"op": "complete", "index": 1}
+    )
+    
+    todos, records = practical_example._replay("todos.jsonl")
+    
+    assert [(todo["task"], todo["completed"]) for todo in todos] == [("First", False), ("Second", True)]
+    assert records == 3
+
+
+def test_replay_drops_torn_last_record(todo_dir):
+    """Test that a half-written last record is dropped and truncated away"""
+    log = todo_dir / "todos.jsonl"
+    _write_log(
+        log,
+        {"op": "create", "todo": {"task": "First", "completed": False}},
+        tail=b'{"op": "create", "todo": {"task": "Sec'
+    )
+    
+    todos, records = practical_example._replay("todos.jsonl")
+    
+    assert [todo["task"] for todo in todos] == ["First"]
+    assert records == 1
+    assert log.read_bytes().endswith(b"}\n")
+
+
+def test_replay_rejects_corrupt_middle_record(todo_dir):
+    """Test that a bad record followed by more records is not silently skipped"""
+    (todo_dir / "todos.jsonl").write_bytes(
+        b'{"op": "create", "todo": {"task": "Fir\n'
+        b'{"op": "create", "todo": {"task": "Second", "completed": false}}\n'
+    )
+    
+    with pytest.raises(ValueError):
+        practical_example._replay("todos.jsonl")
+
+
+@pytest.fixture
+def todo_state(todo_dir, monkeypatch):
+    """Start the server's in-memory todo list empty, logging to todo_dir"""
+    monkeypatch.setattr(practical_example, "_TODOS", [])
+    monkeypatch.setattr(practical_example, "_LOG_RECORDS", 0)
+    return todo_dir
+
+
+async def test_complete_todo_appends_record(todo_state):
+    """Test that completing a todo is logged once and survives a replay"""
+    await practical_example.create_todo.fn("Write tests")
+    
+    assert await practical_example.complete_todo.fn(1) == "Completed todo: 'Write tests'"
+    assert "already completed" in await practical_example.complete_todo.fn(1)
+    
+    todos, records = practical_example._replay("todos.jsonl")
+    assert todos[0]["completed"] is True
+    assert records == 2
+
+
+async def test_failed_append_leaves_todos_unchanged(todo_state, monkeypatch):
+    """Test that a todo is only changed in memory once its record is written"""
+    await practical_example.create_todo.fn("Write tests")
+    
+    def fail(record):
+        raise OSError("disk full")
+    
+    monkeypatch.setattr(practical_example, "_append_record", fail)
+    with pytest.raises(OSError):
+        await practical_example.create_todo.fn("Lost")
+    with pytest.raises(OSError):
+        await practical_example.complete_todo.fn(1)
+    
+    assert [(todo["task"], todo["completed"]) for todo in practical_example._TODOS] == [("Write tests", False)]
+    assert practical_example._LOG_RECORDS == 1
+    todos, records = practical_example._replay("todos.jsonl")
+    assert todos == practical_example._TODOS
+    assert records == 1
+
+
+async def test_compact_todos(todo_state):
+    """Test that compaction rewrites the log as one create record per todo"""
+    await practical_example.create_todo.fn("First")
+    await practical_example.create_todo.fn("Second")
+    await practical_example.complete_todo.fn(2)
+    
+    result = await practical_example.compact_todos.fn()
+    
+    assert result == "Compacted todo log from 3 to 2 records."
+    todos, records = practical_example._replay("todos.jsonl")
+    assert [(todo["task"], todo["completed"]) for todo in todos] == [("First", False), ("Second", True)]
+    assert records == 2
+    assert "already compact" in await practical_example.compact_todos.fn()
+
+
+async def test_get_weather_quotes_city(monkeypatch):
+    """Test that the city is sent as a single escaped path segment"""
+    requested = []
+    
+    async def fake_get(url, params=None):
+        requested.append((url, params))
+        return httpx.Response(200, text="Paris: +20°C\n", request=httpx.Request("GET", url))
+    
+    monkeypatch.setattr(practical_example._HTTP, "get", fake_get)
+    
+    result = await practical_example.get_weather.fn("Paris?format=j1/x")
+    
+    assert result == "Paris: +20°C"
+    assert requested == [("https://wttr.in/Paris%3Fformat%3Dj1%2Fx", {"format": "3"})]
@@ -0,0 +1,64 @@
+"""
+Tests for the Supabase MCP integration server's migration checks.
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent / "src" / "mcp_servers"))
+
+import supabase_integration  # noqa: E402
+
+
+async def validate(tmp_path, sql):
+    migration = tmp_path / "migration.sql"
+    migration.write_text(sql)
+    return await supabase_integration.validate_migration_safety.fn(str(migration))
+
+
+async def test_validate_migration_flags_destructive_statements(tmp_path):
+    """Test that DROP TABLE, TRUNCATE and DELETE FROM warn and ALTER TABLE recommends"""
+    result = await validate(tmp_path, (
+        "drop   table old_projects;\n"
+        "TRUNCATE audit_log;\n"
+        "Delete From sessions WHERE expired;\n"
+        "ALTER TABLE projects ADD COLUMN description TEXT;\n"
+        "alter table projects DROP COLUMN legacy;\n"
+    ))
+    
+    assert result["status"] == "WARNING"
+    assert len(result["warnings"]) == 3
+    assert result["recommendations"] == ["Consider adding rollback SQL for ALTER TABLE operations"]
+
+
+async def test_validate_migration_ignores_comments_and_strings(tmp_path):
+    """Test that commented-out or quoted statements are not reported"""
+    result = await validate(tmp_path, (
+        "-- ALTER TABLE projects ADD COLUMN description TEXT;\n"
+        "/* DROP TABLE projects;\n   TRUNCATE projects; */\n"
+        "INSERT INTO notes (body) VALUES ('never DELETE FROM prod');\n"
+    ))
+    
+    assert result["status"] == "SAFE"
+    assert result["warnings"] == []
+    assert result["recommendations"] == []
+
+
+async def test_validate_generated_migration_is_safe(tmp_path):
+    """Test that the template from generate_migration_from_schema passes cleanly"""
+    sql = supabase_integration._MIGRATION_TPL(name="example", ts="2025-01-01T00:00:00", pid="project")
+    
+    result = await validate(tmp_path, sql)
+    
+    assert result["status"] == "SAFE"
+    assert result["recommendations"] == []
+
+
+async def test_validate_migration_missing_file(tmp_path):
+    """Test that a missing migration file returns an error instead of raising"""
+    missing = str(tmp_path / "missing.sql")
+    
+    result = await supabase_integration.validate_migration_safety.fn(missing)
+    
+    assert result["migration_file"] == missing
+    assert "not found" in result["error"]